@@ -4,7 +4,7 @@
 """
 
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import FrozenSet, List, Literal, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -29,10 +29,20 @@ class Settings(BaseSettings):
     # API密钥配置
     api_keys: List[str] = ["dev-only-key-change-in-production"]  # API密钥列表，用于访问鉴权
 
+    @property
+    def api_keys_set(self) -> FrozenSet[str]:
+        """鉴权用的密钥集合；每次按当前 api_keys 构建，运行时替换密钥列表后立即生效。"""
+        return frozenset(self.api_keys)
+
     # 文件存储配置
     static_dir: str = str(Path(__file__).resolve().parent.parent / "static")  # 静态资源根目录
     templates_dir: str = str(Path(__file__).resolve().parent.parent / "templates")  # Jinja模板目录
     template_name: str = "map_with_filters.html"  # 默认模板文件名
+    xlsx_compress: bool = Field(
+        True,
+        validation_alias="XLSX_COMPRESS",
+        description="xlsx 导出是否 deflate 压缩；下载经由 gzip 代理或内网时可关闭以节省 CPU",
+    )
     file_lifetime_hours: int = Field(
         168,
         validation_alias="FILE_LIFETIME_HOURS",
@@ -45,6 +55,21 @@ class Settings(BaseSettings):
     )
     db_path: str = str(Path(__file__).resolve().parent.parent / "data" / "map.db")  # SQLite 数据文件路径
     db_url: Optional[str] = Field(None, validation_alias="DB_URL", description="数据库连接字符串")
+    db_executor_workers: int = Field(
+        16,
+        validation_alias="DB_EXECUTOR_WORKERS",
+        description="数据库 IO 专用线程池大小",
+    )
+    cpu_executor_workers: Optional[int] = Field(
+        None,
+        validation_alias="CPU_EXECUTOR_WORKERS",
+        description="CPU 密集任务进程池大小，未配置时取 CPU 核数",
+    )
+    cpu_process_pool_enabled: bool = Field(
+        True,
+        validation_alias="CPU_PROCESS_POOL_ENABLED",
+        description="CPU 密集任务是否放入进程池；关闭时在线程中执行（测试用，便于 monkeypatch 生效）",
+    )
 
     @property
     def sqlalchemy_database_uri(self) -> str:
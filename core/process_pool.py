@@ -0,0 +1,72 @@
+"""
+CPU 密集任务的进程池。
+
+H3 网格构建等纯 Python / Shapely 计算受 GIL 限制，放到独立进程执行才能让并发请求用上多核。
+进程池按需创建，应用关闭时回收；使用 spawn 启动，避免在多线程进程中 fork。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from core.config import settings
+
+T = TypeVar("T")
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            workers = settings.cpu_executor_workers or os.cpu_count() or 1
+            _POOL = ProcessPoolExecutor(
+                max_workers=max(1, workers),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _POOL
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _POOL
+    with _POOL_LOCK:
+        # 并发请求可能已经换上新池，只清掉出问题的那一个
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_process_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_process(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    在进程池中执行模块级函数，参数与返回值需可 pickle。
+
+    cpu_process_pool_enabled 关闭时改在线程中执行。
+    """
+    call = functools.partial(func, *args, **kwargs)
+    if not settings.cpu_process_pool_enabled:
+        return await asyncio.to_thread(call)
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    try:
+        return await loop.run_in_executor(pool, call)
+    except BrokenProcessPool:
+        # 任一工作进程异常退出（OOM、扩展模块崩溃）后执行器永久不可用，丢弃后重建并重试一次
+        _discard_broken_pool(pool)
+        return await loop.run_in_executor(get_process_pool(), call)
@@ -3,11 +3,16 @@ from __future__ import annotations
 from hashlib import sha1
 from typing import Any, Callable, Sequence
 
+import numpy as np
+import shapely
 from shapely.geometry import GeometryCollection, MultiPolygon, Polygon
 from shapely.geometry.base import BaseGeometry
-from shapely.ops import transform
 
-from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84, wgs84_to_gcj02
+from modules.providers.amap.utils.transform_posi import (
+    gcj02_to_wgs84_arr,
+    wgs84_to_gcj02,
+    wgs84_to_gcj02_arr,
+)
 
 
 def is_coord_pair(value: Any) -> bool:
@@ -106,16 +111,25 @@ def convert_geometry(
     geom: BaseGeometry,
     converter: Callable[[float, float], tuple[float, float]],
 ) -> BaseGeometry:
-    def _transform(x, y, z=None):
-        try:
-            iter(x)
-            converted = [converter(float(px), float(py)) for px, py in zip(x, y)]
-            xs, ys = zip(*converted) if converted else ((), ())
-            return tuple(xs), tuple(ys)
-        except Exception:
-            return converter(float(x), float(y))
+    # shapely.transform 一次性取出全部坐标 (N, 2)，结果直接写回 ndarray，避免逐点构造 tuple
+    def _transform(coords: np.ndarray) -> np.ndarray:
+        converted = [converter(px, py) for px, py in coords.tolist()]
+        return np.asarray(converted, dtype=np.float64).reshape(-1, 2)
+
+    return shapely.transform(geom, _transform)
+
 
-    return transform(_transform, geom)
+def convert_geometry_arr(
+    geom: BaseGeometry,
+    batch_converter: Callable[[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]],
+) -> BaseGeometry:
+    """convert_geometry 的向量化版本：全部顶点一次送入数组转换函数。"""
+
+    def _transform(coords: np.ndarray) -> np.ndarray:
+        xs, ys = batch_converter(coords[:, 0], coords[:, 1])
+        return np.column_stack((xs, ys))
+
+    return shapely.transform(geom, _transform)
 
 
 def to_wgs84_geometry(polygon: list, coord_type: str) -> BaseGeometry:
@@ -123,7 +137,7 @@ def to_wgs84_geometry(polygon: list, coord_type: str) -> BaseGeometry:
     if geom.is_empty:
         raise ValueError("invalid polygon")
     if coord_type == "gcj02":
-        geom = convert_geometry(geom, gcj02_to_wgs84)
+        geom = convert_geometry_arr(geom, gcj02_to_wgs84_arr)
     geom = geom.buffer(0)
     if geom.is_empty:
         raise ValueError("invalid polygon")
@@ -133,7 +147,7 @@ def to_wgs84_geometry(polygon: list, coord_type: str) -> BaseGeometry:
 def transform_geometry_to_coord_type(geom: Any, coord_type: str) -> Any:
     if coord_type != "gcj02" or geom is None:
         return geom
-    return convert_geometry(geom, wgs84_to_gcj02)
+    return convert_geometry_arr(geom, wgs84_to_gcj02_arr)
 
 
 def transform_point_from_wgs84(lon: float, lat: float, coord_type: str) -> list[float]:
@@ -161,6 +175,31 @@ def transform_polygon_payload_coords(raw: Any, transformer) -> list:
     return nested
 
 
+def copy_nested_coord_points(raw: Any, sink: list[list[Any]]) -> Any:
+    """复制嵌套坐标结构，并把每个坐标点（新列表）登记到 sink，供批量转换原地回写。"""
+    if not isinstance(raw, list):
+        return raw
+    if is_coord_pair(raw):
+        point = list(raw)
+        sink.append(point)
+        return point
+    return [copy_nested_coord_points(item, sink) for item in raw]
+
+
+def apply_batch_transform(
+    points: list[list[Any]],
+    batch_transformer: Callable[[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]],
+) -> None:
+    """把 points 的前两位一次性送入向量化转换函数，并原地回写。"""
+    if not points:
+        return
+    coords = np.array([(point[0], point[1]) for point in points], dtype=np.float64)
+    xs, ys = batch_transformer(coords[:, 0], coords[:, 1])
+    for point, x, y in zip(points, xs.tolist(), ys.tolist()):
+        point[0] = x
+        point[1] = y
+
+
 def build_scope_id(geom_wgs84: BaseGeometry, *parts: Any) -> str:
     prefix = ":".join(str(part) for part in parts if part is not None).encode("utf-8")
     digest = sha1(prefix + b":" + geom_wgs84.wkb).hexdigest()
@@ -18,6 +18,7 @@ from fastapi.staticfiles import StaticFiles
 
 from core.config import settings
 from core.exceptions import BizError
+from core.process_pool import shutdown_process_pool
 from modules.population.runtime_check import run_population_runtime_check
 from router import admin_router, app_router
 from store import init_db
@@ -49,6 +50,7 @@ async def lifespan(_: FastAPI):
         yield
     finally:
         logger.info("应用关闭中...")
+        shutdown_process_pool()
         logger.info("应用已关闭")
 
 async def validation_exception_handler(request, exc):
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 from urllib.parse import unquote
 
 import httpx
+import numpy as np
 
 from core.config import settings
 
@@ -47,6 +48,9 @@ def _svg_to_data_uri(svg_text: str) -> str:
 
 
 def _safe_float(value: Any) -> Optional[float]:
+    # Fast path for the plain numbers that make up almost every input; no exception setup.
+    if type(value) is float:
+        return value if value == value else None
     try:
         if value is None:
             return None
@@ -62,23 +66,6 @@ def _clamp(value: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, value))
 
 
-def _quantile(sorted_values: List[float], q: float) -> Optional[float]:
-    if not sorted_values:
-        return None
-    if len(sorted_values) == 1:
-        return float(sorted_values[0])
-    ratio = _clamp(float(q), 0.0, 1.0)
-    pos = ratio * (len(sorted_values) - 1)
-    lo = int(math.floor(pos))
-    hi = int(math.ceil(pos))
-    if lo == hi:
-        return float(sorted_values[lo])
-    lv = float(sorted_values[lo])
-    hv = float(sorted_values[hi])
-    frac = pos - lo
-    return lv + (hv - lv) * frac
-
-
 def _mix_hex_color(from_hex: str, to_hex: str, ratio: float) -> str:
     r = _clamp(float(ratio), 0.0, 1.0)
     f = str(from_hex or "#000000").lstrip("#")
@@ -104,14 +91,25 @@ def _extract_outer_ring(feature: Dict[str, Any]) -> List[List[float]]:
     if not coordinates:
         return []
     ring = coordinates[0] or []
+    # Rings are validated here once (numeric, finite) so downstream consumers can trust them.
+    # Well-formed rings convert in one numpy call; ragged or dirty rings fall back to per-vertex checks.
+    try:
+        arr = np.asarray(ring, dtype=np.float64)
+    except (TypeError, ValueError):
+        arr = None
+    if arr is not None and arr.ndim == 2 and arr.shape[1] >= 2:
+        # numpy turns None / "nan" into NaN; drop NaN and +-inf vertices, same as the loop below.
+        arr = arr[:, :2]
+        return arr[np.isfinite(arr).all(axis=1)].tolist()
     result: List[List[float]] = []
     for pt in ring:
         if not isinstance(pt, (list, tuple)) or len(pt) < 2:
             continue
-        try:
-            result.append([float(pt[0]), float(pt[1])])
-        except Exception:
+        x = _safe_float(pt[0])
+        y = _safe_float(pt[1])
+        if x is None or y is None or not math.isfinite(x) or not math.isfinite(y):
             continue
+        result.append([x, y])
     return result
 
 
@@ -130,15 +128,13 @@ def _resolve_lisa_render_meta(cell_map: Dict[str, Dict[str, Any]]) -> Dict[str,
             "clip_max": 0.0,
             "degraded": True,
         }
-    sorted_values = sorted(values)
-    n = float(len(sorted_values))
-    mean = sum(values) / n
-    variance = sum((v - mean) * (v - mean) for v in values) / n
-    std = variance ** 0.5
-    min_v = sorted_values[0]
-    max_v = sorted_values[-1]
-    p10 = _quantile(sorted_values, 0.10)
-    p90 = _quantile(sorted_values, 0.90)
+    # Partition-based quantiles and reductions on a float64 array instead of sorting boxed floats.
+    arr = np.asarray(values, dtype=np.float64)
+    mean = float(arr.mean())
+    std = float(arr.std())
+    min_v = float(arr.min())
+    max_v = float(arr.max())
+    p10, p90 = (float(v) for v in np.quantile(arr, [0.10, 0.90]))
     degraded = std <= 1e-12
     if degraded:
         return {
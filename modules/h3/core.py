@@ -2,9 +2,10 @@ import h3
 import logging
 from shapely.geometry import GeometryCollection, MultiPolygon, Polygon, mapping
 from shapely.geometry.base import BaseGeometry
-from shapely.ops import transform
+from shapely.prepared import prep
 from typing import Any, Dict, Iterable, List, Tuple, Literal
-from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84, wgs84_to_gcj02
+from core.spatial import convert_geometry_arr
+from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84_arr, wgs84_to_gcj02
 
 logger = logging.getLogger(__name__)
 
@@ -56,22 +57,10 @@ def _normalize_area_geometry(geom: BaseGeometry) -> BaseGeometry:
 
 def _convert_area_geometry(
     geom: BaseGeometry,
-    converter,
+    batch_converter,
 ) -> BaseGeometry:
-    def _trans(x, y, z=None):
-        try:
-            iter(x)
-            nx = []
-            ny = []
-            for i in range(len(x)):
-                tx, ty = converter(x[i], y[i])
-                nx.append(tx)
-                ny.append(ty)
-            return tuple(nx), tuple(ny)
-        except Exception:
-            return converter(x, y)
-
-    return _normalize_area_geometry(transform(_trans, geom))
+    # 全部顶点一次送入数组转换函数，不再逐坐标用 iter() 异常探测标量/序列
+    return _normalize_area_geometry(convert_geometry_arr(geom, batch_converter))
 
 
 def _is_coord_pair(value: Any) -> bool:
@@ -159,7 +148,7 @@ def polygon_to_hexagons(
     
     # 1. Ensure polygon is WGS84 for H3
     if coord_type == "gcj02":
-        temp_poly = _convert_area_geometry(polygon, gcj02_to_wgs84)
+        temp_poly = _convert_area_geometry(polygon, gcj02_to_wgs84_arr)
     else:
         temp_poly = polygon
     temp_poly = _normalize_area_geometry(temp_poly)
@@ -282,6 +271,8 @@ def hexagons_to_geojson_features(
     normalized_source = _normalize_area_geometry(source_polygon_wgs84)
     if normalized_source.is_empty:
         return features
+    # 同一范围要与每个网格做谓词判断，预处理一次供全部网格复用
+    prepared_source = prep(normalized_source)
 
     for h3_index in sorted(set(hexagons)):
         boundary_wgs84 = get_hexagon_boundary(h3_index, coord_type="wgs84")
@@ -295,9 +286,9 @@ def hexagons_to_geojson_features(
 
         overlap_ratio = 0.0
         if include_mode == "inside":
-            keep = normalized_source.covers(cell_polygon)
+            keep = prepared_source.covers(cell_polygon)
         else:
-            keep = normalized_source.intersects(cell_polygon)
+            keep = prepared_source.intersects(cell_polygon)
             if keep:
                 try:
                     inter_area = normalized_source.intersection(cell_polygon).area
@@ -349,7 +340,7 @@ def build_h3_grid_feature_collection(
         return {"type": "FeatureCollection", "features": [], "count": 0}
 
     if coord_type == "gcj02":
-        source_polygon_wgs84 = _normalize_area_geometry(_convert_area_geometry(input_polygon, gcj02_to_wgs84))
+        source_polygon_wgs84 = _normalize_area_geometry(_convert_area_geometry(input_polygon, gcj02_to_wgs84_arr))
     else:
         source_polygon_wgs84 = input_polygon
 
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException
 
-from core.spatial import transform_polygon_payload_coords
+from core.spatial import apply_batch_transform, copy_nested_coord_points, transform_polygon_payload_coords
 from modules.poi.schemas import HistorySaveRequest
-from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84, wgs84_to_gcj02
+from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84_arr, wgs84_to_gcj02_arr
 
 
 def coerce_extracted_json_value(value: Any) -> Any:
@@ -108,41 +109,30 @@ def build_detail_payload(
     return payload
 
 
-def _is_number(value: Any) -> bool:
-    return isinstance(value, (int, float))
-
-
-def _transform_nested_coords(raw: Any, transformer):
-    if not isinstance(raw, list):
-        return raw
-    if len(raw) >= 2 and _is_number(raw[0]) and _is_number(raw[1]):
-        try:
-            nx, ny = transformer(float(raw[0]), float(raw[1]))
-            out = [nx, ny]
-            if len(raw) > 2:
-                out.extend(raw[2:])
-            return out
-        except Exception:
-            return raw
-    return [_transform_nested_coords(item, transformer) for item in raw]
-
-
-def _transform_geojson_coordinates(value: Any, transformer):
+def _copy_geojson_coordinates(value: Any, sink: List[List[Any]]):
     if isinstance(value, dict):
-        out = {}
-        for key, val in value.items():
-            out[key] = _transform_nested_coords(val, transformer) if key == "coordinates" else _transform_geojson_coordinates(val, transformer)
-        return out
+        return {
+            key: copy_nested_coord_points(val, sink) if key == "coordinates" else _copy_geojson_coordinates(val, sink)
+            for key, val in value.items()
+        }
     if isinstance(value, list):
-        return [_transform_geojson_coordinates(item, transformer) for item in value]
+        return [_copy_geojson_coordinates(item, sink) for item in value]
     return value
 
 
-def _build_history_params_payload(payload: HistorySaveRequest) -> Dict[str, Any]:
+def _copy_location(item: Dict[str, Any], sink: List[List[Any]]) -> None:
+    if item.get("location"):
+        lx, ly = item["location"]
+        point = [lx, ly]
+        item["location"] = point
+        sink.append(point)
+
+
+def _build_history_params_payload(payload: HistorySaveRequest, sink: List[List[Any]]) -> Dict[str, Any]:
     center = payload.center
     if center:
-        wx, wy = gcj02_to_wgs84(center[0], center[1])
-        center = [wx, wy]
+        center = [center[0], center[1]]
+        sink.append(center)
     params_payload: Dict[str, Any] = {
         "center": center,
         "time_min": payload.time_min,
@@ -153,7 +143,7 @@ def _build_history_params_payload(payload: HistorySaveRequest) -> Dict[str, Any]
     if params_payload["source"] not in ("gaode", "local"):
         params_payload["source"] = "local"
     if payload.drawn_polygon:
-        transformed_drawn = _transform_nested_coords(payload.drawn_polygon, gcj02_to_wgs84)
+        transformed_drawn = copy_nested_coord_points(payload.drawn_polygon, sink)
         if isinstance(transformed_drawn, list) and transformed_drawn:
             params_payload["drawn_polygon"] = transformed_drawn
     return params_payload
@@ -171,17 +161,24 @@ def _build_history_description(payload: HistorySaveRequest, params_payload: Dict
 
 
 def save_history_request(payload: HistorySaveRequest, repo) -> Dict[str, Any]:
-    params_payload = _build_history_params_payload(payload)
-    polygon_wgs84 = transform_polygon_payload_coords(payload.polygon, gcj02_to_wgs84) if payload.polygon else []
-
-    pois: List[Dict[str, Any]] = []
-    for poi in payload.pois:
-        item = poi.copy()
-        if item.get("location"):
-            lx, ly = item["location"]
-            wx, wy = gcj02_to_wgs84(lx, ly)
-            item["location"] = [wx, wy]
-        pois.append(item)
+    # 中心点、绘制范围、多边形与 POI 坐标汇总后一次性转换为 WGS84
+    points: List[List[Any]] = []
+    params_payload = _build_history_params_payload(payload, points)
+    polygon_wgs84 = []
+    if payload.polygon:
+        polygon_wgs84 = copy_nested_coord_points(
+            transform_polygon_payload_coords(payload.polygon, lambda lng, lat: (lng, lat)),
+            points,
+        )
+
+    # POI 位置先收集为新列表参与批量转换，转换后一次性解包回写，不再逐条 copy 后修改
+    poi_locations = [[poi["location"][0], poi["location"][1]] if poi.get("location") else None for poi in payload.pois]
+    points.extend(location for location in poi_locations if location is not None)
+    apply_batch_transform(points, gcj02_to_wgs84_arr)
+    pois: List[Dict[str, Any]] = [
+        {**poi, "location": location} if location is not None else dict(poi)
+        for poi, location in zip(payload.pois, poi_locations)
+    ]
 
     desc = _build_history_description(payload, params_payload, len(pois))
     try:
@@ -198,51 +195,46 @@ def get_history_list_payload(limit: int, repo) -> List[Dict[str, Any]]:
 def convert_history_detail_to_gcj02(res: Dict[str, Any], *, include_pois: bool) -> Dict[str, Any]:
     payload = dict(res or {})
     params = payload.get("params") or {}
+    # 先收集全部坐标点，最后一次性转换为 GCJ02
+    points: List[List[Any]] = []
     if params.get("center"):
         cx, cy = params["center"]
-        nx, ny = wgs84_to_gcj02(cx, cy)
-        params["center"] = [nx, ny]
+        params["center"] = [cx, cy]
+        points.append(params["center"])
     if params.get("drawn_polygon"):
-        try:
-            transformed = _transform_nested_coords(params["drawn_polygon"], wgs84_to_gcj02)
-            params["drawn_polygon"] = transformed if isinstance(transformed, list) else []
-        except Exception:
-            params["drawn_polygon"] = []
+        transformed = copy_nested_coord_points(params["drawn_polygon"], points)
+        params["drawn_polygon"] = transformed if isinstance(transformed, list) else []
     if isinstance(params.get("h3_result"), dict):
-        params["h3_result"] = _transform_geojson_coordinates(params["h3_result"], wgs84_to_gcj02)
+        params["h3_result"] = _copy_geojson_coordinates(params["h3_result"], points)
     if isinstance(params.get("road_result"), dict):
-        params["road_result"] = _transform_geojson_coordinates(params["road_result"], wgs84_to_gcj02)
+        params["road_result"] = _copy_geojson_coordinates(params["road_result"], points)
     if payload.get("polygon"):
-        polygon = payload["polygon"]
-
-        def _convert_ring(ring):
-            return [list(wgs84_to_gcj02(point[0], point[1])) for point in ring]
-
-        if polygon and len(polygon) > 0:
-            if isinstance(polygon[0][0], list):
-                payload["polygon"] = [_convert_ring(ring) for ring in polygon]
-            else:
-                payload["polygon"] = _convert_ring(polygon)
+        payload["polygon"] = copy_nested_coord_points(payload["polygon"], points)
 
     if include_pois and payload.get("pois"):
         for poi in payload["pois"]:
-            if poi.get("location"):
-                lx, ly = poi["location"]
-                nlx, nly = wgs84_to_gcj02(lx, ly)
-                poi["location"] = [nlx, nly]
+            _copy_location(poi, points)
+    apply_batch_transform(points, wgs84_to_gcj02_arr)
     return payload
 
 
 def convert_history_pois_to_gcj02(res: Dict[str, Any]) -> Dict[str, Any]:
     payload = dict(res or {})
+    points: List[List[Any]] = []
     for poi in payload.get("pois") or []:
-        if poi.get("location"):
-            lx, ly = poi["location"]
-            nlx, nly = wgs84_to_gcj02(lx, ly)
-            poi["location"] = [nlx, nly]
+        _copy_location(poi, points)
+    apply_batch_transform(points, wgs84_to_gcj02_arr)
     return payload
 
 
+def build_history_detail_etag(history_id: int, include_pois: bool, created_at: Any) -> str:
+    """
+    历史记录写入后不可变，ETag 只取决于 id、创建时间与是否包含 POI。
+    """
+    raw = f"{history_id}:{int(bool(include_pois))}:{serialize_created_at(created_at)}"
+    return f'"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
 def get_history_detail_payload(history_id: int, include_pois: bool, repo) -> Dict[str, Any]:
     res = repo.get_detail(history_id, include_pois=include_pois)
     if not res:
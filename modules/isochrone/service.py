@@ -3,10 +3,13 @@ from __future__ import annotations
 import asyncio
 import math
 import time
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
+import orjson
+import shapely
 from fastapi import HTTPException
 from shapely.geometry import Point, Polygon, mapping
+from shapely.geometry.base import BaseGeometry
 from shapely.ops import unary_union
 
 from core.spatial import (
@@ -136,8 +139,8 @@ def _parse_clip_polygon(
     return clip_poly
 
 
-async def calculate_isochrone_feature(payload: IsochroneRequest) -> dict[str, Any]:
-    start = time.time()
+async def _calculate_isochrone_geometry(payload: IsochroneRequest) -> Tuple[dict[str, Any], BaseGeometry]:
+    start_ns = time.perf_counter_ns()
     lat, lon = payload.lat, payload.lon
     if payload.coord_type == "gcj02":
         lon, lat = gcj02_to_wgs84(payload.lon, payload.lat)
@@ -199,19 +202,34 @@ async def calculate_isochrone_feature(payload: IsochroneRequest) -> dict[str, An
             raise HTTPException(404, "Empty isochrone result after clip")
 
     final_poly = transform_geometry_to_coord_type(final_poly, payload.coord_type)
-    return {
-        "type": "Feature",
-        "properties": {
-            "center": [payload.lon, payload.lat],
-            "time_min": payload.time_min,
-            "mode": payload.mode,
-            "origin_mode": payload.origin_mode,
-            "origin_count": len(sample_points),
-            "scope_clipped": bool(payload.clip_polygon and should_clip_output),
-            "calc_time_ms": int((time.time() - start) * 1000),
-        },
-        "geometry": mapping(final_poly),
+    properties = {
+        "center": [payload.lon, payload.lat],
+        "time_min": payload.time_min,
+        "mode": payload.mode,
+        "origin_mode": payload.origin_mode,
+        "origin_count": len(sample_points),
+        "scope_clipped": bool(payload.clip_polygon and should_clip_output),
+        "calc_time_ms": (time.perf_counter_ns() - start_ns) // 1_000_000,
     }
+    return properties, final_poly
+
+
+async def calculate_isochrone_feature_json(payload: IsochroneRequest) -> bytes:
+    """
+    计算等时圈并输出 GeoJSON Feature 的 JSON 字节。
+
+    几何部分由 GEOS 的 to_geojson 序列化后拼接，避免逐坐标构造 Python 对象再编码。
+    """
+    properties, final_poly = await _calculate_isochrone_geometry(payload)
+    return b"".join(
+        (
+            b'{"type":"Feature","properties":',
+            orjson.dumps(properties),
+            b',"geometry":',
+            shapely.to_geojson(final_poly).encode("utf-8"),
+            b"}",
+        )
+    )
 
 
 async def build_debug_isochrone_samples(payload: IsochroneDebugSampleRequest) -> dict[str, Any]:
@@ -6,6 +6,7 @@ from typing import Any
 from core.spatial import (
     build_scope_id,
     convert_geometry,
+    convert_geometry_arr,
     normalize_ring,
     polygon_from_payload,
     round_float,
@@ -3,9 +3,9 @@ from __future__ import annotations
 from shapely.geometry import shape
 
 from modules.population.service import get_population_grid
-from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84
+from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84_arr
 
-from .common import convert_geometry
+from .common import convert_geometry_arr
 from .types import TargetGridCell
 
 
@@ -28,7 +28,7 @@ def load_target_cells(polygon: list, coord_type: str) -> list[TargetGridCell]:
             continue
         if geom_gcj02.is_empty:
             continue
-        geom_wgs84 = convert_geometry(geom_gcj02, gcj02_to_wgs84).buffer(0)
+        geom_wgs84 = convert_geometry_arr(geom_gcj02, gcj02_to_wgs84_arr).buffer(0)
         if geom_wgs84.is_empty:
             continue
         cells.append(
@@ -37,7 +37,7 @@ def generate_map_json(
     year: Optional[int] = None,
     source: Literal["gaode", "local"] = "gaode",
     pre_points_hook: Optional[
-        Callable[[Dict, str, Optional[Sequence[str]]], Optional[Tuple[int, Dict]]]
+        Callable[[Dict, str], Optional[Tuple[int, Dict]]]
     ] = None,
 ) -> Tuple[Dict, Optional[int]]:
     """
@@ -59,7 +59,7 @@ def generate_map_json(
     if source == "local":
         center = get_position(place, api_key=api_key, mock_response=geocode_mock)
         if pre_points_hook:
-            cached = pre_points_hook(center, search_type, place_types)
+            cached = pre_points_hook(center, search_type)
             if cached:
                 cached_id, body = cached
                 payload = {
@@ -102,7 +102,7 @@ def generate_map_json(
     elif search_type == "around":
         center = get_position(place, api_key=api_key, mock_response=geocode_mock)
         if pre_points_hook:
-            cached = pre_points_hook(center, search_type, place_types)
+            cached = pre_points_hook(center, search_type)
             if cached:
                 cached_id, body = cached
                 payload = {
@@ -127,7 +127,7 @@ def generate_map_json(
     elif search_type == "city":
         center = get_position(place, api_key=api_key, mock_response=geocode_mock)
         if pre_points_hook:
-            cached = pre_points_hook(center, search_type, place_types)
+            cached = pre_points_hook(center, search_type)
             if cached:
                 cached_id, body = cached
                 payload = {
@@ -1,7 +1,7 @@
 from .filter_result import filter_result
 from .get_type_info import get_type_info
 from .merge_poi import merge_poi, poi_to_point
-from .transform_posi import gcj02_to_wgs84, wgs84_to_gcj02
+from .transform_posi import gcj02_to_wgs84, gcj02_to_wgs84_arr, wgs84_to_gcj02, wgs84_to_gcj02_arr
 
 __all__ = [
     "filter_result",
@@ -9,5 +9,7 @@ __all__ = [
     "merge_poi",
     "poi_to_point",
     "gcj02_to_wgs84",
+    "gcj02_to_wgs84_arr",
     "wgs84_to_gcj02",
+    "wgs84_to_gcj02_arr",
 ]
@@ -1,5 +1,44 @@
 import math
 
+import numpy as np
+
+# 克拉索夫斯基椭球参数
+_A = 6378245.0
+_EE = 0.006693421622965943
+_A_1_EE = _A * (1 - _EE)
+_PI = math.pi
+
+
+def _offsets_scalar(lng, lat, sin=math.sin, cos=math.cos, sqrt=math.sqrt, pi=_PI):
+    """
+    WGS84 -> GCJ-02 的偏移量计算核（单位：度），返回 (dlng, dlat)。
+    transform_lat / transform_lng 共有的经度正弦项与 sqrt(|x|) 只算一次，
+    函数与常量绑定为局部名；运算顺序与原公式一致，结果逐位相同。
+    """
+    x = lng - 105.0
+    y = lat - 35.0
+    shared = (20.0 * sin(6.0 * x * pi) + 20.0 * sin(2.0 * x * pi)) * 2.0 / 3.0
+    sqrt_abs_x = sqrt(abs(x))
+    dlat = (
+        -100.0 + 2.0 * x + 3.0 * y + 0.2 * y * y + 0.1 * x * y + 0.2 * sqrt_abs_x
+        + shared
+        + (20.0 * sin(y * pi) + 40.0 * sin(y / 3.0 * pi)) * 2.0 / 3.0
+        + (160.0 * sin(y / 12.0 * pi) + 320 * sin(y * pi / 30.0)) * 2.0 / 3.0
+    )
+    dlng = (
+        300.0 + x + 2.0 * y + 0.1 * x * x + 0.1 * x * y + 0.1 * sqrt_abs_x
+        + shared
+        + (20.0 * sin(x * pi) + 40.0 * sin(x / 3.0 * pi)) * 2.0 / 3.0
+        + (150.0 * sin(x / 12.0 * pi) + 300.0 * sin(x * pi / 30.0)) * 2.0 / 3.0
+    )
+    radlat = lat / 180.0 * pi
+    magic = sin(radlat)
+    magic = 1 - _EE * magic * magic
+    sqrtmagic = sqrt(magic)
+    dlat = (dlat * 180.0) / (_A_1_EE / (magic * sqrtmagic) * pi)
+    dlng = (dlng * 180.0) / (_A / sqrtmagic * cos(radlat) * pi)
+    return dlng, dlat
+
 
 def wgs84_to_gcj02(lng, lat):
     """
@@ -8,29 +47,12 @@ def wgs84_to_gcj02(lng, lat):
     :param lat: WGS84坐标系的纬度
     :return: 转换后的GCJ-02坐标系的经纬度
     """
-    if out_of_china(lng, lat):
+    if not (73.66 < lng < 135.05 and 3.86 < lat < 53.55):
         # 若坐标点不在中国范围内，直接返回原坐标
         return lng, lat
 
-    # 计算转换偏移量
-    dlat = transform_lat(lng - 105.0, lat - 35.0)
-    dlng = transform_lng(lng - 105.0, lat - 35.0)
-
-    # 将纬度转换为弧度
-    radlat = lat / 180.0 * math.pi
-    magic = math.sin(radlat)
-    magic = 1 - 0.006693421622965943 * magic * magic
-    sqrtmagic = math.sqrt(magic)
-
-    # 计算经度和纬度的偏移量
-    dlat = (dlat * 180.0) / ((6378245.0 * (1 - 0.006693421622965943)) / (magic * sqrtmagic) * math.pi)
-    dlng = (dlng * 180.0) / (6378245.0 / sqrtmagic * math.cos(radlat) * math.pi)
-
-    # 计算转换后的坐标
-    gcj02_lat = lat + dlat
-    gcj02_lng = lng + dlng
-
-    return gcj02_lng, gcj02_lat
+    dlng, dlat = _offsets_scalar(lng, lat)
+    return lng + dlng, lat + dlat
 
 
 def gcj02_to_wgs84(lng, lat, max_iter=10, threshold=1e-6):
@@ -86,3 +108,77 @@ def out_of_china(lng, lat):
     判断坐标点是否在中国范围内
     """
     return not (lng > 73.66 and lng < 135.05 and lat > 3.86 and lat < 53.55)
+
+
+def _offsets_arr(lng, lat):
+    """_offsets_scalar 的 numpy 版本。"""
+    x = lng - 105.0
+    y = lat - 35.0
+    shared = (20.0 * np.sin(6.0 * x * _PI) + 20.0 * np.sin(2.0 * x * _PI)) * 2.0 / 3.0
+    sqrt_abs_x = np.sqrt(np.abs(x))
+    dlat = (
+        -100.0 + 2.0 * x + 3.0 * y + 0.2 * y * y + 0.1 * x * y + 0.2 * sqrt_abs_x
+        + shared
+        + (20.0 * np.sin(y * _PI) + 40.0 * np.sin(y / 3.0 * _PI)) * 2.0 / 3.0
+        + (160.0 * np.sin(y / 12.0 * _PI) + 320 * np.sin(y * _PI / 30.0)) * 2.0 / 3.0
+    )
+    dlng = (
+        300.0 + x + 2.0 * y + 0.1 * x * x + 0.1 * x * y + 0.1 * sqrt_abs_x
+        + shared
+        + (20.0 * np.sin(x * _PI) + 40.0 * np.sin(x / 3.0 * _PI)) * 2.0 / 3.0
+        + (150.0 * np.sin(x / 12.0 * _PI) + 300.0 * np.sin(x * _PI / 30.0)) * 2.0 / 3.0
+    )
+    radlat = lat / 180.0 * _PI
+    magic = np.sin(radlat)
+    magic = 1 - _EE * magic * magic
+    sqrtmagic = np.sqrt(magic)
+    dlat = (dlat * 180.0) / (_A_1_EE / (magic * sqrtmagic) * _PI)
+    dlng = (dlng * 180.0) / (_A / sqrtmagic * np.cos(radlat) * _PI)
+    return dlng, dlat
+
+
+def _out_of_china_arr(lng, lat):
+    return ~((lng > 73.66) & (lng < 135.05) & (lat > 3.86) & (lat < 53.55))
+
+
+def wgs84_to_gcj02_arr(lng, lat):
+    """
+    wgs84_to_gcj02 的向量化版本
+    :param lng: WGS84 经度数组
+    :param lat: WGS84 纬度数组
+    :return: (gcj02_lng, gcj02_lat) 两个 float64 数组
+    """
+    lng = np.asarray(lng, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    dlng, dlat = _offsets_arr(lng, lat)
+
+    # 国外坐标保持原值
+    outside = _out_of_china_arr(lng, lat)
+    return np.where(outside, lng, lng + dlng), np.where(outside, lat, lat + dlat)
+
+
+def gcj02_to_wgs84_arr(lng, lat, max_iter=10, threshold=1e-6):
+    """
+    gcj02_to_wgs84 的向量化版本，各点独立判断收敛，结果与逐点迭代一致。
+    :param lng: GCJ-02 经度数组
+    :param lat: GCJ-02 纬度数组
+    :return: (wgs84_lng, wgs84_lat) 两个 float64 数组
+    """
+    lng = np.asarray(lng, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    guess_lng = lng.copy()
+    guess_lat = lat.copy()
+
+    active = np.flatnonzero(~_out_of_china_arr(lng, lat))
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        calc_lng, calc_lat = wgs84_to_gcj02_arr(guess_lng[active], guess_lat[active])
+        d_lng = calc_lng - lng[active]
+        d_lat = calc_lat - lat[active]
+        pending = (np.abs(d_lng) >= threshold) | (np.abs(d_lat) >= threshold)
+        active = active[pending]
+        guess_lng[active] -= d_lng[pending]
+        guess_lat[active] -= d_lat[pending]
+
+    return guess_lng, guess_lat
@@ -1,15 +1,16 @@
-import asyncio
 import json
 import logging
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
 
-from fastapi import APIRouter, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import Response
 
 from core.config import settings
-from modules.admin.schemas import AdminMapRecord, AdminMapListResponse
-from modules.map_manage.schemas import PolygonRecord
-from store import delete_map, list_maps_with_polygons
+from modules.admin.schemas import AdminMapListResponse
+from router.utils.http_cache import build_etag, etag_matches, not_modified_response
+from store import delete_map, list_maps_with_polygons, run_db
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +21,8 @@ def _parse_fingerprint(fingerprint: str) -> Dict[str, Any]:
     if not fingerprint:
         return {}
     try:
-        return json.loads(fingerprint)
-    except json.JSONDecodeError:
+        return orjson.loads(fingerprint)
+    except orjson.JSONDecodeError:
         return {}
 
 
@@ -48,50 +49,57 @@ def _build_map_url(
     return f"{base_url}/map?{urlencode(params)}"
 
 
+def _build_admin_map_payload(record: Dict[str, Any]) -> Dict[str, Any]:
+    fingerprint_payload = _parse_fingerprint(record.get("center_fingerprint", ""))
+    source = fingerprint_payload.get("source") or None
+    year = fingerprint_payload.get("year")
+    return {
+        "id": record["id"],
+        "created_at": record["created_at"],
+        "search_type": record["search_type"],
+        "center": record["center"],
+        "source": source,
+        "year": year,
+        "map_url": _build_map_url(
+            record.get("search_type"),
+            record.get("center") or {},
+            source,
+            year,
+            fingerprint_payload.get("place_types") or [],
+        ),
+        "polygons": record.get("polygons", []),
+    }
+
+
 @router.get(
     "/maps",
     response_model=AdminMapListResponse,
     summary="获取后台地图列表",
 )
 async def list_admin_maps(
+    request: Request,
     limit: int = Query(200, ge=1, le=500),
     offset: int = Query(0, ge=0),
 ):
     """
     获取地图列表，包含多边形信息，用于后台管理展示。
+
+    记录直接以 dict 经 orjson 输出，AdminMapListResponse 仅用于 OpenAPI 文档。
+    弱 ETag 取自序列化后的响应体，内容未变化时返回 304，省去响应体传输。
     """
-    maps = await asyncio.to_thread(list_maps_with_polygons, limit=limit, offset=offset)
-    response_maps: List[AdminMapRecord] = []
-    for record in maps:
-        fingerprint_payload = _parse_fingerprint(record.get("center_fingerprint", ""))
-        source = fingerprint_payload.get("source") or None
-        year = fingerprint_payload.get("year")
-        place_types = fingerprint_payload.get("place_types") or []
-        map_url = _build_map_url(
-            record.get("search_type"),
-            record.get("center") or {},
-            source,
-            year,
-            place_types,
-        )
-        polygons = [
-            PolygonRecord(id=item["id"], coordinates=item["coordinates"])
-            for item in record.get("polygons", [])
-        ]
-        response_maps.append(
-            AdminMapRecord(
-                id=record["id"],
-                created_at=record["created_at"],
-                search_type=record["search_type"],
-                center=record["center"],
-                source=source,
-                year=year,
-                map_url=map_url,
-                polygons=polygons,
-            )
-        )
+    maps = await run_db(list_maps_with_polygons, limit=limit, offset=offset)
+    response_maps = [_build_admin_map_payload(record) for record in maps]
+    content = orjson.dumps(
+        {"maps": response_maps},
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+    etag = build_etag(content, weak=True)
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, etag):
+        return not_modified_response(cache_headers)
+
     logger.info("后台地图列表获取成功 count=%s", len(response_maps))
-    return AdminMapListResponse(maps=response_maps)
+    return Response(content=content, media_type="application/json", headers=cache_headers)
 
 
 @router.delete(
@@ -102,7 +110,7 @@ async def delete_admin_map(map_id: int):
     """
     删除地图及其关联多边形。
     """
-    deleted = await asyncio.to_thread(delete_map, map_id)
+    deleted = await run_db(delete_map, map_id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Query
 
 from core.config import settings
+from core.process_pool import run_in_process
 from modules.h3.analysis import analyze_h3_grid
 from modules.h3.analysis_schemas import H3MetricsRequest, H3MetricsResponse
 from modules.h3.core import build_h3_grid_feature_collection
@@ -15,6 +16,15 @@ from modules.h3.schemas import GridRequest, GridResponse
 
 router = APIRouter()
 
+# 分辨率较低时网格规模小，序列化开销大于并行收益，仍在线程中执行
+H3_PROCESS_POOL_MIN_RESOLUTION = 9
+
+
+async def _run_h3_task(resolution: int, func, /, *args: Any, **kwargs: Any):
+    if resolution >= H3_PROCESS_POOL_MIN_RESOLUTION:
+        return await run_in_process(func, *args, **kwargs)
+    return await asyncio.to_thread(func, *args, **kwargs)
+
 
 def _normalize_boundary_ring(path: Any) -> List[List[float]]:
     ring: List[List[float]] = []
@@ -134,7 +144,8 @@ def _load_city_boundary_ring(city_name: str) -> Dict[str, Any]:
 
 @router.post("/api/v1/analysis/h3-grid", response_model=GridResponse)
 async def build_h3_grid(payload: GridRequest):
-    feature_collection = await asyncio.to_thread(
+    feature_collection = await _run_h3_task(
+        payload.resolution,
         build_h3_grid_feature_collection,
         payload.polygon,
         payload.resolution,
@@ -153,12 +164,10 @@ async def get_city_boundary(city: str = Query("长沙市", description="城市
 
 @router.post("/api/v1/analysis/h3-metrics", response_model=H3MetricsResponse)
 async def analyze_h3_metrics(payload: H3MetricsRequest):
-    poi_payload = [
-        p.model_dump() if hasattr(p, "model_dump") else p.dict()
-        for p in payload.pois
-    ]
+    poi_payload = payload.model_dump(include={"pois"})["pois"]
     try:
-        result = await asyncio.to_thread(
+        result = await _run_h3_task(
+            payload.resolution,
             analyze_h3_grid,
             polygon=payload.polygon,
             resolution=payload.resolution,
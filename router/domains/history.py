@@ -1,22 +1,25 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 
 import modules.history.service as history_service
 from modules.poi.schemas import HistorySaveRequest
-from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84, wgs84_to_gcj02
+from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84_arr, wgs84_to_gcj02_arr
+from router.utils.http_cache import etag_matches, not_modified_response
+from store.executor import run_db
 from store.history_repo import history_repo
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 def _sync_history_converters() -> None:
-    history_service.gcj02_to_wgs84 = gcj02_to_wgs84
-    history_service.wgs84_to_gcj02 = wgs84_to_gcj02
+    history_service.gcj02_to_wgs84_arr = gcj02_to_wgs84_arr
+    history_service.wgs84_to_gcj02_arr = wgs84_to_gcj02_arr
 
 
 @router.post("/api/v1/analysis/history/save")
 async def save_history_manually(payload: HistorySaveRequest):
     _sync_history_converters()
-    return history_service.save_history_request(payload, history_repo)
+    return await run_db(history_service.save_history_request, payload, history_repo)
 
 
 @router.get("/api/v1/analysis/history")
@@ -32,9 +35,25 @@ async def get_history_pois(id: int):
 
 
 @router.get("/api/v1/analysis/history/{id}")
-async def get_history_detail(id: int, include_pois: bool = Query(True)):
+async def get_history_detail(
+    id: int,
+    request: Request,
+    response: Response,
+    include_pois: bool = Query(True),
+):
     _sync_history_converters()
-    return history_service.get_history_detail_payload(id, include_pois, history_repo)
+    if request.headers.get("if-none-match"):
+        # 记录不可变：带条件请求时先用创建时间比对 ETag，命中时跳过详情查询、坐标转换与序列化
+        created_at = await run_db(history_repo.get_created_at, id)
+        if created_at is None:
+            raise HTTPException(404, "Record not found")
+        etag = history_service.build_history_detail_etag(id, include_pois, created_at)
+        if etag_matches(request, etag):
+            return not_modified_response({"ETag": etag, "Cache-Control": "private, no-cache"})
+    payload = history_service.get_history_detail_payload(id, include_pois, history_repo)
+    response.headers["ETag"] = history_service.build_history_detail_etag(id, include_pois, payload.get("created_at"))
+    response.headers["Cache-Control"] = "private, no-cache"
+    return payload
 
 
 @router.delete("/api/v1/analysis/history/{id}")
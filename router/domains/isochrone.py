@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
-from modules.isochrone.service import build_debug_isochrone_samples, calculate_isochrone_feature
+from fastapi.responses import Response
+from modules.isochrone.service import build_debug_isochrone_samples, calculate_isochrone_feature_json
 from modules.isochrone.schemas import (
     IsochroneDebugSampleRequest,
     IsochroneDebugSampleResponse,
@@ -13,7 +14,8 @@ router = APIRouter()
 @router.post("/api/v1/analysis/isochrone", response_model=IsochroneResponse)
 async def calculate_isochrone(payload: IsochroneRequest):
     try:
-        return await calculate_isochrone_feature(payload)
+        content = await calculate_isochrone_feature_json(payload)
+        return Response(content=content, media_type="application/json")
     except HTTPException:
         raise
 
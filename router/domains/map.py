@@ -4,7 +4,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from io import BytesIO
+from functools import partial
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, HTTPException, Security
@@ -21,10 +21,11 @@ from modules.map_manage.schemas import (
 from modules.providers.amap.schemas import MapGenerateRequest, MapResponse
 from router.utils.deps import load_map_request, verify_api_key
 from store import (
+    build_center_fingerprint,
     delete_polygon,
-    find_map_by_center_and_type,
-    get_map_data,
+    find_map_by_fingerprint,
     list_polygons_for_map,
+    run_db,
     save_map_data,
     save_polygon,
 )
@@ -33,6 +34,8 @@ from utils import export_map_to_xlsx
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+XLSX_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 @router.post("/api/v1/generate-map", response_model=MapResponse, summary="生成地图数据")
 async def generate_map(
@@ -42,18 +45,18 @@ async def generate_map(
     try:
         logger.info("Generating map for: %s", request.place)
 
-        def pre_points_hook(center, search_type, place_types=None):
-            normalized_pt = tuple(sorted({item for item in (place_types or []) if item}))
-            src = request.source or "gaode"
-            y = request.year or datetime.now().year
-            existing = find_map_by_center_and_type(center, search_type, normalized_pt, src, y)
+        normalized_place_types = tuple(sorted({item for item in (request.place_types or []) if item}))
+        src = request.source or "gaode"
+        y = request.year or datetime.now().year
+
+        def pre_points_hook(center, search_type):
+            # 未命中时会写入新地图，必须直接查库，不能使用 /map 页面的 TTL 缓存
+            fingerprint = build_center_fingerprint(center, search_type, normalized_place_types, src, y)
+            existing = find_map_by_fingerprint(fingerprint)
             if existing:
                 return existing[0], existing[1]
             return None
 
-        src = request.source or "gaode"
-        y = request.year or datetime.now().year
-
         map_payload, cached_id = generate_map_json(
             place=request.place,
             search_type=request.type,
@@ -68,12 +71,12 @@ async def generate_map(
         map_req = MapRequest(**map_payload["body"])
 
         if cached_id is None:
-            cached_id = await asyncio.to_thread(
+            cached_id = await run_db(
                 save_map_data,
                 map_req.model_dump(),
                 map_req.center,
                 request.type,
-                tuple(sorted({i for i in (request.place_types or []) if i})),
+                normalized_place_types,
                 src,
                 y,
             )
@@ -98,9 +101,11 @@ async def generate_map(
 @router.get("/api/v1/maps/{map_id}/export/xlsx")
 async def export_map_xlsx(map_id: int):
     map_req = await load_map_request(map_id)
-    fname, content = export_map_to_xlsx(map_req, map_id)
+    # 导出是同步的 CPU 工作，放到线程里执行，避免大地图导出阻塞事件循环
+    fname, buffer = await asyncio.to_thread(export_map_to_xlsx, map_req, map_id)
+    # 按固定块读取缓冲区；直接迭代 BytesIO 会按换行符切出大量零碎块
     return StreamingResponse(
-        BytesIO(content),
+        iter(partial(buffer.read, XLSX_STREAM_CHUNK_SIZE), b""),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f'attachment; filename="{fname}"'},
     )
@@ -108,25 +113,23 @@ async def export_map_xlsx(map_id: int):
 
 @router.get("/api/v1/maps/{map_id}/polygons", response_model=PolygonListResponse)
 async def list_map_polygons(map_id: int):
-    map_data = await asyncio.to_thread(get_map_data, map_id)
-    if not map_data:
+    polygons = await run_db(list_polygons_for_map, map_id)
+    if polygons is None:
         raise HTTPException(404, "Map not found")
-    polygons = await asyncio.to_thread(list_polygons_for_map, map_id)
     return {"polygons": polygons}
 
 
 @router.post("/api/v1/maps/{map_id}/polygons", response_model=PolygonRecord)
 async def create_map_polygon(map_id: int, payload: PolygonCreateRequest):
-    map_data = await asyncio.to_thread(get_map_data, map_id)
-    if not map_data:
+    pid = await run_db(save_polygon, map_id, payload.coordinates)
+    if pid is None:
         raise HTTPException(404, "Map not found")
-    pid = await asyncio.to_thread(save_polygon, map_id, payload.coordinates)
     return {"id": pid, "coordinates": payload.coordinates}
 
 
 @router.delete("/api/v1/maps/{map_id}/polygons/{polygon_id}")
 async def delete_map_polygon(map_id: int, polygon_id: int):
-    success = await asyncio.to_thread(delete_polygon, map_id, polygon_id)
+    success = await run_db(delete_polygon, map_id, polygon_id)
     if not success:
         raise HTTPException(404, "Polygon not found")
     return {"status": "ok"}
@@ -3,14 +3,16 @@ from __future__ import annotations
 import logging
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
-from core.spatial import transform_polygon_payload_coords
+from core.spatial import apply_batch_transform, copy_nested_coord_points, transform_polygon_payload_coords
 from modules.poi.core import fetch_local_pois_by_polygon, fetch_pois_by_polygon
 from modules.poi.schemas import PoiRequest, PoiResponse
-from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84
+from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84_arr
+from store.executor import run_db
 from store.history_repo import history_repo
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 
@@ -37,29 +39,35 @@ async def fetch_pois_analysis(payload: PoiRequest):
         raise HTTPException(status_code=502, detail=str(exc)) from exc
 
     if payload.save_history:
+        # 中心点、多边形与 POI 坐标汇总后一次性转换为 WGS84
+        points = []
         s_center = payload.center
         if s_center:
-            wx, wy = gcj02_to_wgs84(s_center[0], s_center[1])
-            s_center = [wx, wy]
+            s_center = [s_center[0], s_center[1]]
+            points.append(s_center)
 
         s_poly = []
         if payload.polygon:
-            s_poly = transform_polygon_payload_coords(payload.polygon, gcj02_to_wgs84)
+            s_poly = copy_nested_coord_points(
+                transform_polygon_payload_coords(payload.polygon, lambda lng, lat: (lng, lat)),
+                points,
+            )
 
-        s_pois = []
-        for p in results:
-            np = p.copy()
-            if np.get("location"):
-                lx, ly = np["location"]
-                nwx, nwy = gcj02_to_wgs84(lx, ly)
-                np["location"] = [nwx, nwy]
-            s_pois.append(np)
+        # POI 位置与中心点、多边形同批转换，转换结果直接回写到新的 location 列表
+        poi_locations = [[p["location"][0], p["location"][1]] if p.get("location") else None for p in results]
+        points.extend(location for location in poi_locations if location is not None)
+        apply_batch_transform(points, gcj02_to_wgs84_arr)
+        s_pois = [
+            {**p, "location": location} if location is not None else dict(p)
+            for p, location in zip(results, poi_locations)
+        ]
 
         desc = f"{payload.keywords} - {len(results)} POIs"
         if payload.time_min:
             desc = f"{payload.time_min}min - {desc}"
 
-        history_repo.create_record(
+        await run_db(
+            history_repo.create_record,
             {
                 "center": s_center,
                 "time_min": payload.time_min,
@@ -1,58 +1,105 @@
 from __future__ import annotations
 
 import os
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse, HTMLResponse, Response
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response, StreamingResponse
 
 from core.config import settings
 from modules.map_manage.schemas import MapRequest
+from router.utils.http_cache import build_etag, etag_matches, not_modified_response
 from store import (
     build_center_fingerprint,
-    find_map_by_fingerprint,
+    find_map_by_fingerprint_cached,
+    run_db,
 )
-from utils import generate_html_content, load_type_config, parse_json
+from utils import TypeConfigError, load_type_config, parse_json, stream_html_content
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.get("/health", summary="健康检查")
-async def health_check():
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "version": "1.0.0",
-    }
+def _load_favicon_bytes() -> Optional[bytes]:
+    icon_path = os.path.join(settings.static_dir, "favicon.ico")
+    if not os.path.exists(icon_path):
+        return None
+    with open(icon_path, "rb") as fh:
+        return fh.read()
 
 
-@router.get("/", summary="根路径")
-async def root():
-    return {
+# 浏览器会频繁请求 favicon，启动时读入内存，避免每次请求都访问文件系统
+_FAVICON_BYTES = _load_favicon_bytes()
+_FAVICON_HEADERS = {"Cache-Control": "public, max-age=86400"}
+
+
+# 探活请求频繁，响应体缓存 1 秒，时间戳只需在秒级保持新鲜
+HEALTH_BODY_TTL_SEC = 1.0
+_health_cache: tuple[float, bytes] = (float("-inf"), b"")
+_ROOT_BODY = orjson.dumps(
+    {
         "message": "欢迎使用高德地图扣子插件API",
         "docs": f"{settings.app_base_url}/docs",
         "health": f"{settings.app_base_url}/health",
     }
+)
+
+
+@router.get("/health", summary="健康检查")
+async def health_check():
+    global _health_cache
+    now = time.monotonic()
+    if now - _health_cache[0] > HEALTH_BODY_TTL_SEC:
+        body = orjson.dumps(
+            {
+                "status": "healthy",
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+                "version": "1.0.0",
+            }
+        )
+        _health_cache = (now, body)
+    return Response(content=_health_cache[1], media_type="application/json")
+
+
+@router.get("/", summary="根路径")
+async def root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @router.get("/favicon.ico", include_in_schema=False)
 async def favicon():
-    icon_path = os.path.join(settings.static_dir, "favicon.ico")
-    if os.path.exists(icon_path):
-        return FileResponse(icon_path)
+    if _FAVICON_BYTES is not None:
+        return Response(content=_FAVICON_BYTES, media_type="image/x-icon", headers=_FAVICON_HEADERS)
     return Response(status_code=204)
 
 
+@lru_cache(maxsize=1)
+def _frontend_config_payload() -> tuple[bytes, dict[str, str]]:
+    # 配置与类型映射在运行期不变，响应体和 ETag 只需计算一次
+    content = orjson.dumps(
+        {
+            "amap_js_api_key": settings.amap_js_api_key,
+            "amap_js_security_code": settings.amap_js_security_code,
+            "tianditu_key": settings.tianditu_key,
+            "map_type_config_json": load_type_config(),
+        }
+    )
+    return content, {"ETag": build_etag(content), "Cache-Control": "public, max-age=300"}
+
+
 @router.get("/api/v1/config", summary="获取APP配置")
-async def get_frontend_config():
-    return {
-        "amap_js_api_key": settings.amap_js_api_key,
-        "amap_js_security_code": settings.amap_js_security_code,
-        "tianditu_key": settings.tianditu_key,
-        "map_type_config_json": load_type_config(),
-    }
+async def get_frontend_config(request: Request):
+    try:
+        content, cache_headers = _frontend_config_payload()
+    except TypeConfigError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    if etag_matches(request, cache_headers["ETag"]):
+        return not_modified_response(cache_headers)
+    return Response(content=content, media_type="application/json", headers=cache_headers)
 
 
 @router.get("/map", response_class=HTMLResponse, summary="渲染常规地图")
@@ -87,14 +134,16 @@ async def render_map_page(
         effective_year,
     )
 
-    existing = find_map_by_fingerprint(fingerprint)
+    existing = await run_db(find_map_by_fingerprint_cached, fingerprint)
     if not existing:
         raise HTTPException(status_code=404, detail="Map data not found")
 
     map_id, map_data, _ = existing
     map_req = MapRequest(**map_data)
-    html_content = await generate_html_content(map_req, map_id=map_id)
-    return HTMLResponse(content=html_content)
+    return StreamingResponse(
+        stream_html_content(map_req, map_id=map_id),
+        media_type="text/html",
+    )
 
 
 @router.get("/analysis", response_class=FileResponse, summary="渲染分析工作台")
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 
 from fastapi import HTTPException, Security, status
@@ -6,7 +5,7 @@ from fastapi.security import APIKeyHeader
 
 from core.config import settings
 from modules.map_manage.schemas import MapRequest
-from store import get_map_data
+from store import get_map_data, run_db
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +24,9 @@ async def verify_api_key(api_key: str = Security(api_key_header)) -> bool:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    api_key_clean = api_key.replace("Bearer ", "") if api_key.startswith("Bearer ") else api_key
+    api_key_clean = api_key[7:] if api_key[:7] == "Bearer " else api_key
 
-    if api_key_clean not in settings.api_keys:
+    if api_key_clean not in settings.api_keys_set:
         logger.warning("无效的API密钥尝试: %s...", api_key[:10])
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -43,7 +42,7 @@ async def load_map_request(map_id: int) -> MapRequest:
     """
     从数据库加载并校验地图数据。
     """
-    map_data_dict = await asyncio.to_thread(get_map_data, map_id)
+    map_data_dict = await run_db(get_map_data, map_id)
     if not map_data_dict:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
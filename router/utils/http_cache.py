@@ -0,0 +1,31 @@
+"""
+HTTP 条件请求（ETag / 304）辅助函数。
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def build_etag(payload: bytes, weak: bool = False) -> str:
+    digest = hashlib.md5(payload).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    判断 If-None-Match 是否命中（按弱比较，忽略 W/ 前缀）。
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(item.strip().removeprefix("W/") == target for item in header.split(","))
+
+
+def not_modified_response(headers: dict) -> Response:
+    return Response(status_code=304, headers=headers)
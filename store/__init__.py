@@ -15,10 +15,12 @@ _LAZY_EXPORTS = {
     "build_center_fingerprint": (".fingerprint", "build_center_fingerprint"),
     "delete_polygon": (".polygon_repo", "delete_polygon"),
     "list_polygons_for_map": (".polygon_repo", "list_polygons_for_map"),
+    "run_db": (".executor", "run_db"),
     "save_polygon": (".polygon_repo", "save_polygon"),
     "delete_map": (".map_repo", "delete_map"),
     "find_map_by_center_and_type": (".map_repo", "find_map_by_center_and_type"),
     "find_map_by_fingerprint": (".map_repo", "find_map_by_fingerprint"),
+    "find_map_by_fingerprint_cached": (".map_repo", "find_map_by_fingerprint_cached"),
     "get_map_data": (".map_repo", "get_map_data"),
     "list_maps_with_polygons": (".map_repo", "list_maps_with_polygons"),
     "save_map_data": (".map_repo", "save_map_data"),
@@ -48,10 +50,12 @@ __all__ = [
     "delete_polygon",
     "find_map_by_center_and_type",
     "find_map_by_fingerprint",
+    "find_map_by_fingerprint_cached",
     "get_map_data",
     "init_db",
     "list_maps_with_polygons",
     "list_polygons_for_map",
+    "run_db",
     "save_map_data",
     "save_polygon",
 ]
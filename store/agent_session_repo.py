@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import desc
+from sqlalchemy import delete, desc
 from sqlalchemy.orm import Session
 
 from .database import SessionLocal
@@ -129,7 +129,6 @@ class AgentSessionRepo:
             record.snapshot = next_snapshot
             record.updated_at = now
             session.commit()
-            session.refresh(record)
             return self._build_detail_payload(record)
         except Exception:
             session.rollback()
@@ -174,7 +173,6 @@ class AgentSessionRepo:
 
             record.updated_at = now
             session.commit()
-            session.refresh(record)
             return self._build_detail_payload(record)
         except Exception:
             session.rollback()
@@ -185,7 +183,10 @@ class AgentSessionRepo:
     def delete_record(self, session_id: str) -> bool:
         session: Session = SessionLocal()
         try:
-            rows = session.query(AgentSession).filter_by(id=session_id).delete()
+            rows = session.execute(
+                delete(AgentSession).where(AgentSession.id == session_id),
+                execution_options={"synchronize_session": False},
+            ).rowcount
             session.commit()
             return rows > 0
         except Exception:
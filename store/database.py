@@ -4,15 +4,20 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import math
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Iterator, Optional
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import Column, Index, MetaData, String, Table, create_engine, event, inspect
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from core.config import settings
-from .models import Base
+from .models import Base, MapData
 
 logger = logging.getLogger(__name__)
 
@@ -21,31 +26,121 @@ def _sqlite_uri() -> str:
     return f"sqlite:///{settings.db_path}"
 
 
+# WAL 让读写互不阻塞，synchronous=NORMAL 在 WAL 下仍保证一致性且省去每次提交的 fsync；
+# SQLite 默认不执行外键约束，需按连接开启，ON DELETE CASCADE 才会生效
+_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for statement in _SQLITE_PRAGMAS:
+            cursor.execute(statement)
+    finally:
+        cursor.close()
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _has_non_finite_float(value) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def _json_serializer(value) -> str:
+    # JSON 列（地图、POI、会话快照）体积较大，用 orjson 编码；遇到其不支持的类型时回退标准库
+    try:
+        text = orjson.dumps(value, option=_ORJSON_OPTIONS).decode("utf-8")
+    except orjson.JSONEncodeError:
+        return json.dumps(value, ensure_ascii=False)
+    # orjson 会把 NaN/Infinity 静默写成 null；结果含 null 时再确认一次，
+    # 有非有限浮点数则交给标准库，保持与以前一致写出 NaN/Infinity
+    if "null" in text and _has_non_finite_float(value):
+        return json.dumps(value, ensure_ascii=False)
+    return text
+
+
+def _json_deserializer(text):
+    # 早期由标准库写入的数据可能含 NaN/Infinity，orjson 不接受时回退标准库解析
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
 def _build_engine(db_uri: str | None = None):
     """
     构建 SQLAlchemy 引擎并确保数据目录存在。
     """
     effective_db_uri = db_uri or settings.sqlalchemy_database_uri
     connect_args = {}
-    if "sqlite" in effective_db_uri:
+    pool_kwargs = {}
+    is_sqlite = "sqlite" in effective_db_uri
+    if is_sqlite:
         db_path = Path(settings.db_path).resolve()
         db_path.parent.mkdir(parents=True, exist_ok=True)
         connect_args = {"check_same_thread": False}
+    else:
+        # 连接池与 DB 线程池同规模，避免线程排队等连接；溢出连接留给线程池外的零星调用
+        workers = max(1, int(settings.db_executor_workers))
+        pool_kwargs = {"pool_size": workers, "max_overflow": workers}
 
-    return create_engine(
+    built = create_engine(
         effective_db_uri,
         connect_args=connect_args,
         future=True,
         pool_pre_ping=True,  # Auto-reconnect
         pool_recycle=3600,
+        # 突发请求后优先复用最近归还的热连接，多余的空闲连接自然老化回收
+        pool_use_lifo=True,
+        json_serializer=_json_serializer,
+        json_deserializer=_json_deserializer,
+        **pool_kwargs,
     )
+    if is_sqlite:
+        event.listen(built, "connect", _apply_sqlite_pragmas)
+    return built
 
 
 engine = _build_engine()
-SessionLocal = sessionmaker(autoflush=False, autocommit=False, future=True)
+# 路由不注入会话：仓储函数经 run_db 在 DB 线程池中各自打开、关闭会话，
+# 因此不提供请求级的 get_db 依赖（会话不能跨线程共享）。
+# 提交后紧接着就关闭会话，不必让实例过期，读取 id 等属性时也就不会再触发一次 SELECT
+SessionLocal = sessionmaker(autoflush=False, autocommit=False, expire_on_commit=False, future=True)
 SessionLocal.configure(bind=engine)
 
 
+@contextmanager
+def session_scope(session_factory: Optional[Callable[[], Session]] = None) -> Iterator[Session]:
+    """
+    事务作用域：正常结束时提交，异常时回滚，最后关闭会话。
+
+    仓储模块传入各自引用的 SessionLocal，便于测试按模块替换会话工厂。
+    """
+    session = (session_factory or SessionLocal)()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 def _rebind_engine(next_engine) -> None:
     global engine
     engine = next_engine
@@ -62,16 +157,37 @@ def _fallback_to_sqlite(exc: Exception) -> None:
     )
 
 
+# 已被复合索引 ix_mapdata_fp_created 取代的旧单列索引
+_LEGACY_MAP_DATA_INDEXES = ("ix_map_data_center_fingerprint",)
+
+
+def _drop_legacy_map_data_indexes() -> None:
+    existing = {index["name"] for index in inspect(engine).get_indexes(MapData.__tablename__)}
+    # 用独立的 MetaData 描述旧索引，避免把它挂回 MapData 表定义
+    legacy_table = Table(MapData.__tablename__, MetaData(), Column("center_fingerprint", String(512)))
+    for name in _LEGACY_MAP_DATA_INDEXES:
+        if name in existing:
+            Index(name, legacy_table.c.center_fingerprint).drop(bind=engine)
+
+
+def _create_schema() -> None:
+    Base.metadata.create_all(bind=engine)
+    # create_all 不会给已存在的表补建或删除索引，旧库在此单独处理
+    _drop_legacy_map_data_indexes()
+    for index in MapData.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+
 def init_db() -> None:
     """
     创建表结构（幂等）。
     """
     try:
-        Base.metadata.create_all(bind=engine)
+        _create_schema()
     except SQLAlchemyError as exc:
         current_uri = settings.sqlalchemy_database_uri
         if "sqlite" in current_uri:
             raise
         _fallback_to_sqlite(exc)
-        Base.metadata.create_all(bind=engine)
+        _create_schema()
     logger.info("数据库初始化完成: %s", settings.db_path)
@@ -0,0 +1,29 @@
+"""
+数据库 IO 专用线程池。
+
+与 asyncio 默认执行器隔离，避免数据库调用与 Shapely 等 CPU 密集任务争抢工作线程。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from core.config import settings
+
+T = TypeVar("T")
+
+DB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(1, settings.db_executor_workers),
+    thread_name_prefix="db",
+)
+
+
+async def run_db(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    在数据库线程池中执行同步仓储函数。
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(DB_EXECUTOR, functools.partial(func, *args, **kwargs))
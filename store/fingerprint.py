@@ -4,9 +4,36 @@
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
+import orjson
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _fingerprint_text(
+    lng,
+    lat,
+    search_type: str,
+    place_types: Tuple[str, ...],
+    source: str,
+    year: Optional[int],
+) -> str:
+    fingerprint_payload = {
+        "lng": lng,
+        "lat": lat,
+        "type": search_type,
+        "place_types": place_types,
+        "source": source,
+        "year": year,
+    }
+    # 与历史 json.dumps(sort_keys=True, ensure_ascii=False, separators=(",", ":")) 输出逐字节一致，
+    # 已入库的指纹无需迁移
+    return orjson.dumps(
+        fingerprint_payload,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    ).decode("utf-8")
+
 
 def _center_fingerprint(
     center: Dict,
@@ -20,16 +47,20 @@ def _center_fingerprint(
     """
     try:
         center = center or {}
-        normalized_place_types = tuple(sorted({item for item in (place_types or ()) if item}))
-        fingerprint_payload = {
-            "lng": center.get("lng"),
-            "lat": center.get("lat"),
-            "type": (search_type or "").strip(),
-            "place_types": normalized_place_types,
-            "source": (source or "").strip(),
-            "year": year,
-        }
-        return json.dumps(fingerprint_payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        args = (
+            center.get("lng"),
+            center.get("lat"),
+            (search_type or "").strip(),
+            tuple(sorted({item for item in (place_types or ()) if item})),
+            (source or "").strip(),
+            year,
+        )
+        # 同一中心点会被反复查询，规范化参数后命中缓存即可跳过序列化；
+        # typed=True 保证 1 与 1.0 不共用缓存（两者序列化结果不同），参数不可哈希时直接计算
+        try:
+            return _fingerprint_text(*args)
+        except TypeError:
+            return _fingerprint_text.__wrapped__(*args)
     except Exception:
         return ""
 
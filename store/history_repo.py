@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import desc, func
+from sqlalchemy import delete, desc, func
 from sqlalchemy.orm import Session
 
 from modules.history.service import (
@@ -17,6 +18,8 @@ from modules.history.service import (
 from .database import SessionLocal
 from .models import AnalysisHistory, PoiResult
 
+_LIST_PARAM_KEYS = ("center", "time_min", "keywords", "mode", "source")
+
 
 class HistoryRepo:
     @staticmethod
@@ -26,6 +29,17 @@ class HistoryRepo:
             return func.json_unquote(extracted)
         return extracted
 
+    @classmethod
+    def _list_param_columns(cls, dialect_name: str) -> Optional[List[Any]]:
+        """
+        列表只需 params 中的几个字段；能在数据库端取字段时不再读出整份 params（含 h3/路网结果）。
+        """
+        if dialect_name in {"mysql", "sqlite"}:
+            return [cls._json_extract_expr(dialect_name, f"$.{key}").label(key) for key in _LIST_PARAM_KEYS]
+        if dialect_name == "postgresql":
+            return [AnalysisHistory.params[key].label(key) for key in _LIST_PARAM_KEYS]
+        return None
+
     def _find_same_history_ids_for_overwrite(self, session: Session, params: Dict[str, Any]) -> List[int]:
         incoming_key = build_history_overwrite_key(build_list_params_from_params(params))
         rows = (
@@ -45,8 +59,16 @@ class HistoryRepo:
         try:
             same_ids = self._find_same_history_ids_for_overwrite(session, params)
             if same_ids:
-                session.query(PoiResult).filter(PoiResult.history_id.in_(same_ids)).delete(synchronize_session=False)
-                session.query(AnalysisHistory).filter(AnalysisHistory.id.in_(same_ids)).delete(synchronize_session=False)
+                # 显式删除 POI 结果：ON DELETE CASCADE 只在开启外键约束的连接上生效，
+                # 未经 SQLite 外键监听的引擎、旧库或 MyISAM 表都会留下孤儿行
+                session.execute(
+                    delete(PoiResult).where(PoiResult.history_id.in_(same_ids)),
+                    execution_options={"synchronize_session": False},
+                )
+                session.execute(
+                    delete(AnalysisHistory).where(AnalysisHistory.id.in_(same_ids)),
+                    execution_options={"synchronize_session": False},
+                )
 
             history = AnalysisHistory(
                 params=params,
@@ -58,11 +80,14 @@ class HistoryRepo:
             session.flush()
 
             if pois:
+                # 写入时一次算好按类型的计数，读取详情时直接使用
+                summary = dict(Counter(str(poi.get("type") or "unknown") for poi in pois))
+                summary["total"] = len(pois)
                 session.add(
                     PoiResult(
                         history_id=history.id,
                         poi_data=pois,
-                        summary={"total": len(pois)},
+                        summary=summary,
                     )
                 )
 
@@ -79,17 +104,14 @@ class HistoryRepo:
         try:
             bind = session.get_bind()
             dialect_name = bind.dialect.name if bind is not None else ""
-            if dialect_name in {"mysql", "sqlite"}:
+            param_columns = self._list_param_columns(dialect_name)
+            if param_columns is not None:
                 query = (
                     session.query(
                         AnalysisHistory.id,
                         AnalysisHistory.description,
                         AnalysisHistory.created_at,
-                        self._json_extract_expr(dialect_name, "$.center").label("center"),
-                        self._json_extract_expr(dialect_name, "$.time_min").label("time_min"),
-                        self._json_extract_expr(dialect_name, "$.keywords").label("keywords"),
-                        self._json_extract_expr(dialect_name, "$.mode").label("mode"),
-                        self._json_extract_expr(dialect_name, "$.source").label("source"),
+                        *param_columns,
                     )
                     .order_by(desc(AnalysisHistory.id))
                 )
@@ -132,11 +154,18 @@ class HistoryRepo:
     def get_detail(self, history_id: int, include_pois: bool = True) -> Optional[Dict]:
         session: Session = SessionLocal()
         try:
-            history = session.query(AnalysisHistory).filter_by(id=history_id).first()
-            if not history:
+            # 历史记录与 POI 结果外连接，一次往返同时取回两表数据
+            poi_column = PoiResult if include_pois else PoiResult.summary
+            row = (
+                session.query(AnalysisHistory, poi_column)
+                .outerjoin(PoiResult, PoiResult.history_id == AnalysisHistory.id)
+                .filter(AnalysisHistory.id == history_id)
+                .first()
+            )
+            if not row:
                 return None
+            history, poi_res = row
             if include_pois:
-                poi_res = session.query(PoiResult).filter_by(history_id=history_id).first()
                 pois = poi_res.poi_data if poi_res and isinstance(poi_res.poi_data, list) else []
                 poi_summary = poi_res.summary if poi_res and isinstance(poi_res.summary, dict) else {}
                 return build_detail_payload(
@@ -146,17 +175,25 @@ class HistoryRepo:
                     poi_count=len(pois),
                 )
 
-            poi_row = session.query(PoiResult.summary).filter_by(history_id=history_id).first()
-            poi_summary = poi_row[0] if poi_row and isinstance(poi_row[0], dict) else {}
-            poi_count = int(poi_summary.get("total") or 0) if isinstance(poi_summary, dict) else 0
+            poi_summary = poi_res if isinstance(poi_res, dict) else {}
+            poi_count = int(poi_summary.get("total") or 0)
             return build_detail_payload(
                 history,
-                poi_summary=poi_summary if isinstance(poi_summary, dict) else {},
+                poi_summary=poi_summary,
                 poi_count=poi_count,
             )
         finally:
             session.close()
 
+    def get_created_at(self, history_id: int) -> Optional[datetime]:
+        """仅查询创建时间，供详情接口生成 ETag；记录不存在时返回 None。"""
+        session: Session = SessionLocal()
+        try:
+            row = session.query(AnalysisHistory.created_at).filter_by(id=history_id).first()
+            return row[0] if row else None
+        finally:
+            session.close()
+
     def get_pois(self, history_id: int) -> Optional[Dict]:
         session: Session = SessionLocal()
         try:
@@ -173,8 +210,15 @@ class HistoryRepo:
     def delete_record(self, history_id: int) -> bool:
         session: Session = SessionLocal()
         try:
-            session.query(PoiResult).filter_by(history_id=history_id).delete()
-            rows = session.query(AnalysisHistory).filter_by(id=history_id).delete()
+            # 不依赖 ON DELETE CASCADE，先显式删除 POI 结果（原因同 create_record）
+            session.execute(
+                delete(PoiResult).where(PoiResult.history_id == history_id),
+                execution_options={"synchronize_session": False},
+            )
+            rows = session.execute(
+                delete(AnalysisHistory).where(AnalysisHistory.id == history_id),
+                execution_options={"synchronize_session": False},
+            ).rowcount
             session.commit()
             return rows > 0
         except Exception:
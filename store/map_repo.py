@@ -5,17 +5,36 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
+from sqlalchemy.orm import load_only, selectinload
 
-from .database import SessionLocal
+from .database import SessionLocal, session_scope
 from .fingerprint import _center_fingerprint
 from .models import MapData, MapPolygonLink, PolygonData
 
 logger = logging.getLogger(__name__)
 
+# /map 页面按指纹反复查询同一份地图，进程内缓存命中结果；未命中不缓存，
+# 其他进程新写入的地图立即可见。本进程写入/删除时整体失效，其他进程的删除依靠 TTL 收敛
+MAP_LOOKUP_CACHE_MAX_ENTRIES = 1024
+MAP_LOOKUP_CACHE_TTL_SEC = 60.0
+_MAP_LOOKUP_CACHE: "OrderedDict[str, Tuple[float, Tuple[int, Dict, Optional[datetime]]]]" = OrderedDict()
+_MAP_LOOKUP_CACHE_LOCK = threading.Lock()
+
+
+LIST_MAPS_BATCH_SIZE = 50
+
+
+def clear_map_lookup_cache() -> None:
+    with _MAP_LOOKUP_CACHE_LOCK:
+        _MAP_LOOKUP_CACHE.clear()
+
 
 def save_map_data(
     map_data: Dict,
@@ -28,27 +47,26 @@ def save_map_data(
     """
     保存地图数据，返回自增主键。
     """
-    session = SessionLocal()
     try:
-        normalized_type = (search_type or "").strip()
-        record = MapData(
-            data=map_data,
-            center=center,
-            center_fingerprint=_center_fingerprint(center, normalized_type, place_types, source, year),
-            search_type=normalized_type,
-            expires_at=None,
-        )
-        session.add(record)
-        session.commit()
-        session.refresh(record)
-        logger.info("地图数据已保存，id=%s", record.id)
-        return record.id
+        with session_scope(SessionLocal) as session:
+            normalized_type = (search_type or "").strip()
+            record = MapData(
+                data=map_data,
+                center=center,
+                center_fingerprint=_center_fingerprint(center, normalized_type, place_types, source, year),
+                search_type=normalized_type,
+                expires_at=None,
+            )
+            session.add(record)
+            # flush 后主键已回填，提交前取出即可，无需 refresh 再查一次整行
+            session.flush()
+            record_id = record.id
     except Exception:
-        session.rollback()
         logger.exception("保存地图数据失败")
         raise
-    finally:
-        session.close()
+    clear_map_lookup_cache()
+    logger.info("地图数据已保存，id=%s", record_id)
+    return record_id
 
 
 def get_map_data(map_id: int) -> Optional[Dict]:
@@ -57,8 +75,7 @@ def get_map_data(map_id: int) -> Optional[Dict]:
     """
     session = SessionLocal()
     try:
-        stmt = select(MapData).where(MapData.id == map_id)
-        record = session.execute(stmt).scalar_one_or_none()
+        record = session.get(MapData, map_id)
         if not record:
             return None
         return record.data
@@ -76,24 +93,10 @@ def find_map_by_center_and_type(
     """
     按中心点指纹查找记录，返回 (id, data, expires_at)。
     """
-    session = SessionLocal()
-    try:
-        normalized_type = (search_type or "").strip()
-        fingerprint = _center_fingerprint(center, normalized_type, place_types, source, year)
-        stmt = (
-            select(MapData)
-            .where(
-                MapData.center_fingerprint == fingerprint,
-            )
-            .order_by(MapData.created_at.desc())
-        )
-        # 仅取最新一条，避免重复数据导致 MultipleResultsFound
-        record = session.scalars(stmt.limit(1)).first()
-        if not record:
-            return None
-        return record.id, record.data, record.expires_at
-    finally:
-        session.close()
+    # 指纹计算本身有 LRU 缓存，这里只负责规范化参数后复用按指纹查询
+    return find_map_by_fingerprint(
+        _center_fingerprint(center, (search_type or "").strip(), place_types, source, year)
+    )
 
 
 def find_map_by_fingerprint(
@@ -121,50 +124,70 @@ def find_map_by_fingerprint(
         session.close()
 
 
+def find_map_by_fingerprint_cached(
+    fingerprint: str,
+) -> Optional[Tuple[int, Dict, Optional[datetime]]]:
+    """
+    带 TTL 缓存的 find_map_by_fingerprint，只缓存命中结果。
+    返回的 data 为共享对象，调用方不得修改。
+    """
+    if not fingerprint:
+        return None
+    now = time.monotonic()
+    with _MAP_LOOKUP_CACHE_LOCK:
+        cached = _MAP_LOOKUP_CACHE.get(fingerprint)
+        if cached is not None and cached[0] > now:
+            _MAP_LOOKUP_CACHE.move_to_end(fingerprint)
+            return cached[1]
+
+    result = find_map_by_fingerprint(fingerprint)
+    if result is None:
+        return None
+    with _MAP_LOOKUP_CACHE_LOCK:
+        _MAP_LOOKUP_CACHE[fingerprint] = (now + MAP_LOOKUP_CACHE_TTL_SEC, result)
+        _MAP_LOOKUP_CACHE.move_to_end(fingerprint)
+        while len(_MAP_LOOKUP_CACHE) > MAP_LOOKUP_CACHE_MAX_ENTRIES:
+            _MAP_LOOKUP_CACHE.popitem(last=False)
+    return result
+
+
 def list_maps_with_polygons(limit: int = 200, offset: int = 0) -> List[Dict]:
     """
     获取地图列表及其关联的多边形数据。
     """
     session = SessionLocal()
     try:
+        # 只加载列表所需的列，多边形由 selectin 加载器按 IN (...) 批量取回；
+        # 按批次流式读取地图行，不先把整页 ORM 对象物化成列表
         maps_stmt = (
-            select(
-                MapData.id,
-                MapData.center,
-                MapData.search_type,
-                MapData.center_fingerprint,
-                MapData.created_at,
+            select(MapData)
+            .options(
+                load_only(
+                    MapData.id,
+                    MapData.center,
+                    MapData.search_type,
+                    MapData.center_fingerprint,
+                    MapData.created_at,
+                ),
+                selectinload(MapData.polygons).load_only(PolygonData.id, PolygonData.coordinates),
             )
             .order_by(MapData.created_at.desc())
             .offset(offset)
             .limit(limit)
         )
-        map_rows = session.execute(maps_stmt).all()
-        if not map_rows:
-            return []
-        map_ids = [row[0] for row in map_rows]
-        polygon_stmt = (
-            select(MapPolygonLink.map_id, PolygonData.id, PolygonData.coordinates)
-            .join(PolygonData, PolygonData.id == MapPolygonLink.polygon_id)
-            .where(MapPolygonLink.map_id.in_(map_ids))
-            .order_by(MapPolygonLink.created_at.asc(), PolygonData.id.asc())
-        )
-        polygon_rows = session.execute(polygon_stmt).all()
-        polygons_by_map: Dict[int, List[Dict]] = {}
-        for map_id, polygon_id, coordinates in polygon_rows:
-            polygons_by_map.setdefault(map_id, []).append(
-                {"id": polygon_id, "coordinates": coordinates}
-            )
         return [
             {
-                "id": row[0],
-                "center": row[1],
-                "search_type": row[2],
-                "center_fingerprint": row[3],
-                "created_at": row[4],
-                "polygons": polygons_by_map.get(row[0], []),
+                "id": record.id,
+                "center": record.center,
+                "search_type": record.search_type,
+                "center_fingerprint": record.center_fingerprint,
+                "created_at": record.created_at,
+                "polygons": [
+                    {"id": polygon.id, "coordinates": polygon.coordinates}
+                    for polygon in record.polygons
+                ],
             }
-            for row in map_rows
+            for record in session.scalars(maps_stmt.execution_options(yield_per=LIST_MAPS_BATCH_SIZE))
         ]
     finally:
         session.close()
@@ -174,39 +197,34 @@ def delete_map(map_id: int) -> bool:
     """
     删除地图及其关联关系，清理无人引用的多边形。
     """
-    session = SessionLocal()
     try:
-        map_record = session.execute(
-            select(MapData).where(MapData.id == map_id)
-        ).scalar_one_or_none()
-        if not map_record:
-            return False
-        polygon_ids = [
-            row[0]
-            for row in session.execute(
-                select(MapPolygonLink.polygon_id).where(MapPolygonLink.map_id == map_id)
-            ).all()
-        ]
-        session.execute(
-            MapPolygonLink.__table__.delete().where(MapPolygonLink.map_id == map_id)
-        )
-        session.delete(map_record)
-        for polygon_id in polygon_ids:
-            remaining = session.execute(
-                select(MapPolygonLink).where(MapPolygonLink.polygon_id == polygon_id).limit(1)
-            ).scalar_one_or_none()
-            if not remaining:
-                polygon = session.execute(
-                    select(PolygonData).where(PolygonData.id == polygon_id)
-                ).scalar_one_or_none()
-                if polygon:
-                    session.delete(polygon)
-        session.commit()
-        logger.info("地图已删除 map_id=%s", map_id)
-        return True
+        with session_scope(SessionLocal) as session:
+            # 先确认地图存在再改动关联表：提前 return 会让 session_scope 提交已执行的删除
+            if session.execute(select(MapData.id).where(MapData.id == map_id)).first() is None:
+                return False
+            polygon_ids = [
+                row[0]
+                for row in session.execute(
+                    select(MapPolygonLink.polygon_id).where(MapPolygonLink.map_id == map_id)
+                ).all()
+            ]
+            # 旧库中的关联表建于声明 ON DELETE CASCADE 之前，仍显式删除关联行以兼容；
+            # 地图本身直接按主键删除，不再为此读出整份地图 JSON
+            session.execute(
+                MapPolygonLink.__table__.delete().where(MapPolygonLink.map_id == map_id)
+            )
+            session.execute(delete(MapData).where(MapData.id == map_id))
+            if polygon_ids:
+                # 一条 DELETE 清理已无任何关联的多边形，避免逐个多边形各查两次
+                still_linked = select(MapPolygonLink.id).where(MapPolygonLink.polygon_id == PolygonData.id)
+                session.execute(
+                    PolygonData.__table__.delete()
+                    .where(PolygonData.id.in_(polygon_ids))
+                    .where(~still_linked.exists())
+                )
     except Exception:
-        session.rollback()
         logger.exception("删除地图失败 map_id=%s", map_id)
         raise
-    finally:
-        session.close()
+    clear_map_lookup_cache()
+    logger.info("地图已删除 map_id=%s", map_id)
+    return True
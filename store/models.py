@@ -12,33 +12,51 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
 
+# PostgreSQL 上使用二进制存储的 JSONB，读取时免去逐次解析文本；其他数据库仍为通用 JSON
+JSONColumn = JSON().with_variant(JSONB(), "postgresql")
+
 
 class MapData(Base):
     __tablename__ = "map_data"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    data = Column(JSON, nullable=False)
-    center = Column(JSON, nullable=False)
-    center_fingerprint = Column(String(512), nullable=False, index=True)
+    data = Column(JSONColumn, nullable=False)
+    center = Column(JSONColumn, nullable=False)
+    center_fingerprint = Column(String(512), nullable=False)
     search_type = Column(String(20), nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     expires_at = Column(DateTime, nullable=True)
 
+    # 按指纹取最新一条：复合索引直接给出 created_at 有序的区间，免去排序
+    __table_args__ = (
+        Index("ix_mapdata_fp_created", "center_fingerprint", "created_at"),
+    )
+
+    # 只读关系：关联行由仓储函数显式维护，这里仅用于批量预加载
+    polygons = relationship(
+        "PolygonData",
+        secondary="map_polygon_links",
+        order_by="(MapPolygonLink.created_at, PolygonData.id)",
+        viewonly=True,
+    )
+
 
 class PolygonData(Base):
     __tablename__ = "polygon_data"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    coordinates = Column(JSON, nullable=False)
+    coordinates = Column(JSONColumn, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
 
@@ -46,8 +64,8 @@ class MapPolygonLink(Base):
     __tablename__ = "map_polygon_links"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    map_id = Column(Integer, ForeignKey("map_data.id"), nullable=False, index=True)
-    polygon_id = Column(Integer, ForeignKey("polygon_data.id"), nullable=False, index=True)
+    map_id = Column(Integer, ForeignKey("map_data.id", ondelete="CASCADE"), nullable=False, index=True)
+    polygon_id = Column(Integer, ForeignKey("polygon_data.id", ondelete="CASCADE"), nullable=False, index=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     __table_args__ = (
@@ -65,10 +83,10 @@ class AnalysisHistory(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     
     # 存储分析参数 (中心点, 时长, 出行方式)
-    params = Column(JSON, nullable=False)
+    params = Column(JSONColumn, nullable=False)
     
     # 存储生成的等时圈多边形 (GeoJSON/Coordinates)
-    result_polygon = Column(JSON, nullable=True)
+    result_polygon = Column(JSONColumn, nullable=True)
     
     # 简短描述 (e.g. "人民广场 - 15分钟步行")
     description = Column(String(255), nullable=True)
@@ -84,10 +102,10 @@ class PoiResult(Base):
     history_id = Column(Integer, ForeignKey("analysis_history.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # 完整的 POI 数据列表
-    poi_data = Column(JSON, nullable=False)
+    poi_data = Column(JSONColumn, nullable=False)
     
     # 统计摘要 (e.g. {"咖啡": 50, "便利店": 30})
-    summary = Column(JSON, nullable=True)
+    summary = Column(JSONColumn, nullable=True)
     
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
@@ -104,6 +122,6 @@ class AgentSession(Base):
     status = Column(String(64), nullable=False, default="idle")
     is_pinned = Column(Boolean, nullable=False, default=False, index=True)
     pinned_at = Column(DateTime, nullable=True)
-    snapshot = Column(JSON, nullable=False, default=dict)
+    snapshot = Column(JSONColumn, nullable=False, default=dict)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
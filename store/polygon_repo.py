@@ -5,52 +5,61 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import insert, literal, select
 
-from .database import SessionLocal
-from .models import MapPolygonLink, PolygonData
+from .database import SessionLocal, session_scope
+from .models import MapData, MapPolygonLink, PolygonData
 
 logger = logging.getLogger(__name__)
 
 
-def save_polygon(map_id: int, coordinates: list) -> int:
+def save_polygon(map_id: int, coordinates: list) -> Optional[int]:
     """
-    保存多边形坐标并绑定 map_id，返回多边形 id。
+    保存多边形坐标并绑定 map_id，返回多边形 id；地图不存在时返回 None。
     """
-    session = SessionLocal()
     try:
-        polygon = PolygonData(coordinates=coordinates)
-        session.add(polygon)
-        session.flush()
-        link = MapPolygonLink(map_id=map_id, polygon_id=polygon.id)
-        session.add(link)
-        session.commit()
-        session.refresh(polygon)
-        logger.info("多边形已保存，map_id=%s polygon_id=%s", map_id, polygon.id)
-        return polygon.id
+        with session_scope(SessionLocal) as session:
+            polygon = PolygonData(coordinates=coordinates)
+            session.add(polygon)
+            session.flush()
+            polygon_id = polygon.id
+            # 关联行用 INSERT ... SELECT 从地图表取 map_id，存在性校验与写入合为一条语句；
+            # 地图不存在时不插入任何行，回滚掉刚写入的多边形即可
+            link_stmt = insert(MapPolygonLink).from_select(
+                ["map_id", "polygon_id", "created_at"],
+                select(MapData.id, literal(polygon_id), literal(datetime.utcnow())).where(MapData.id == map_id),
+            )
+            if session.execute(link_stmt).rowcount == 0:
+                session.rollback()
+                return None
     except Exception:
-        session.rollback()
         logger.exception("保存多边形失败 map_id=%s", map_id)
         raise
-    finally:
-        session.close()
+    logger.info("多边形已保存，map_id=%s polygon_id=%s", map_id, polygon_id)
+    return polygon_id
 
 
-def list_polygons_for_map(map_id: int) -> list:
+def list_polygons_for_map(map_id: int) -> Optional[list]:
     """
-    获取地图关联的多边形列表。
+    获取地图关联的多边形列表；地图不存在时返回 None。
     """
     session = SessionLocal()
     try:
+        # 以地图为左表外连接，一次查询同时完成存在性校验与多边形读取
         stmt = (
-            select(PolygonData.id, PolygonData.coordinates)
-            .join(MapPolygonLink, MapPolygonLink.polygon_id == PolygonData.id)
-            .where(MapPolygonLink.map_id == map_id)
+            select(MapData.id, PolygonData.id, PolygonData.coordinates)
+            .outerjoin(MapPolygonLink, MapPolygonLink.map_id == MapData.id)
+            .outerjoin(PolygonData, PolygonData.id == MapPolygonLink.polygon_id)
+            .where(MapData.id == map_id)
             .order_by(MapPolygonLink.created_at.asc(), PolygonData.id.asc())
         )
         rows = session.execute(stmt).all()
-        return [{"id": row[0], "coordinates": row[1]} for row in rows]
+        if not rows:
+            return None
+        return [{"id": row[1], "coordinates": row[2]} for row in rows if row[1] is not None]
     finally:
         session.close()
 
@@ -59,34 +68,27 @@ def delete_polygon(map_id: int, polygon_id: int) -> bool:
     """
     删除指定地图关联的多边形记录。
     """
-    session = SessionLocal()
     try:
-        link_stmt = select(MapPolygonLink).where(
-            MapPolygonLink.map_id == map_id,
-            MapPolygonLink.polygon_id == polygon_id,
-        )
-        link = session.execute(link_stmt).scalar_one_or_none()
-        if not link:
-            return False
-        session.delete(link)
-        session.flush()
+        with session_scope(SessionLocal) as session:
+            link_stmt = select(MapPolygonLink).where(
+                MapPolygonLink.map_id == map_id,
+                MapPolygonLink.polygon_id == polygon_id,
+            )
+            link = session.execute(link_stmt).scalar_one_or_none()
+            if not link:
+                return False
+            session.delete(link)
+            session.flush()
 
-        remaining = session.execute(
-            select(MapPolygonLink).where(MapPolygonLink.polygon_id == polygon_id).limit(1)
-        ).scalar_one_or_none()
-        if not remaining:
-            polygon = session.execute(
-                select(PolygonData).where(PolygonData.id == polygon_id)
+            remaining = session.execute(
+                select(MapPolygonLink).where(MapPolygonLink.polygon_id == polygon_id).limit(1)
             ).scalar_one_or_none()
-            if polygon:
-                session.delete(polygon)
-
-        session.commit()
-        logger.info("多边形已删除 map_id=%s polygon_id=%s", map_id, polygon_id)
-        return True
+            if not remaining:
+                polygon = session.get(PolygonData, polygon_id)
+                if polygon:
+                    session.delete(polygon)
     except Exception:
-        session.rollback()
         logger.exception("删除多边形失败 map_id=%s polygon_id=%s", map_id, polygon_id)
         raise
-    finally:
-        session.close()
+    logger.info("多边形已删除 map_id=%s polygon_id=%s", map_id, polygon_id)
+    return True
@@ -0,0 +1,101 @@
+import os
+from datetime import datetime
+
+os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import router.admin as admin_router_module
+import store.map_repo as map_repo_module
+from main import app
+from store.models import Base
+
+
+def test_admin_map_list_builds_records_from_repo_dicts(monkeypatch):
+    records = [
+        {
+            "id": 7,
+            "search_type": "around",
+            "center": {"lng": 112.9388, "lat": 28.2282},
+            "center_fingerprint": '{"lat":28.2282,"lng":112.9388,"place_types":["咖啡"],"source":"osm","type":"around","year":2024}',
+            "created_at": datetime(2025, 1, 2, 3, 4, 5),
+            "polygons": [{"id": 3, "coordinates": [[112.9, 28.2], [113.0, 28.3], [112.9, 28.2]]}],
+        },
+        {
+            "id": 8,
+            "search_type": "around",
+            "center": {"lng": 113.0, "lat": 28.0},
+            "center_fingerprint": "not-json",
+            "created_at": datetime(2025, 1, 3),
+            "polygons": [],
+        },
+    ]
+    monkeypatch.setattr(admin_router_module, "list_maps_with_polygons", lambda limit, offset: records)
+    client = TestClient(app)
+
+    resp = client.get("/api/v1/admin/maps")
+
+    assert resp.status_code == 200
+    maps = resp.json()["maps"]
+    assert [item["id"] for item in maps] == [7, 8]
+    assert maps[0]["source"] == "osm"
+    assert maps[0]["year"] == 2024
+    assert maps[0]["created_at"] == "2025-01-02T03:04:05"
+    assert maps[0]["polygons"] == records[0]["polygons"]
+    assert "source=osm" in maps[0]["map_url"] and "year=2024" in maps[0]["map_url"]
+    assert maps[1]["source"] is None
+    assert maps[1]["year"] is None
+
+
+def _install_map_repo(monkeypatch):
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(
+        map_repo_module,
+        "SessionLocal",
+        sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True),
+    )
+
+
+def _save_map(lng):
+    return map_repo_module.save_map_data(
+        {"center": {"lng": lng, "lat": 28.2282}, "points": []},
+        {"lng": lng, "lat": 28.2282},
+        "around",
+        ("咖啡",),
+        "gaode",
+        2025,
+    )
+
+
+def test_admin_map_list_returns_304_until_maps_change(monkeypatch):
+    _install_map_repo(monkeypatch)
+    _save_map(112.9388)
+    newest_id = _save_map(113.0)
+    client = TestClient(app)
+
+    first = client.get("/api/v1/admin/maps")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+
+    cached = client.get("/api/v1/admin/maps", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    other_page = client.get("/api/v1/admin/maps?offset=1", headers={"If-None-Match": etag})
+    assert other_page.status_code == 200
+
+    # SQLite reuses the deleted rowid, so count and max(id) alone would look unchanged.
+    assert map_repo_module.delete_map(newest_id)
+    assert _save_map(113.5) == newest_id
+    changed = client.get("/api/v1/admin/maps", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
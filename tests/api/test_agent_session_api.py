@@ -1,5 +1,4 @@
 import os
-import sys
 import importlib.util
 from pathlib import Path
 
@@ -10,7 +9,6 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
-sys.path.append(str(ROOT_DIR))
 os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
 
 import store.agent_session_repo as agent_session_repo_module
@@ -0,0 +1,37 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+
+os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
+
+from core.config import settings
+from router.utils.deps import verify_api_key
+
+
+def test_verify_api_key_accepts_bearer_and_raw_keys():
+    key = settings.api_keys[0]
+
+    assert asyncio.run(verify_api_key(f"Bearer {key}")) is True
+    assert asyncio.run(verify_api_key(key)) is True
+
+
+@pytest.mark.parametrize("api_key", [None, "", "Bearer not-a-key", f"Bearer{settings.api_keys[0]}"])
+def test_verify_api_key_rejects_missing_or_unknown_keys(api_key):
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(verify_api_key(api_key))
+
+    assert exc.value.status_code == 401
+
+
+def test_verify_api_key_follows_reassigned_api_keys(monkeypatch):
+    old_key = settings.api_keys[0]
+    assert asyncio.run(verify_api_key(old_key)) is True
+
+    monkeypatch.setattr(settings, "api_keys", ["rotated-key"])
+
+    assert asyncio.run(verify_api_key("Bearer rotated-key")) is True
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(verify_api_key(old_key))
+    assert exc.value.status_code == 401
@@ -0,0 +1,23 @@
+import os
+
+os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+def test_frontend_config_sets_cache_headers_and_honours_etag():
+    client = TestClient(app)
+
+    resp = client.get("/api/v1/config")
+
+    assert resp.status_code == 200
+    assert resp.headers["cache-control"] == "public, max-age=300"
+    assert "map_type_config_json" in resp.json()
+    etag = resp.headers["etag"]
+
+    cached = client.get("/api/v1/config", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
@@ -2,14 +2,11 @@ import asyncio
 import io
 import json
 import os
-import sys
 import zipfile
-from pathlib import Path
 
 import pytest
 from fastapi import HTTPException
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
 os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
 
 from modules.export.schemas import AnalysisExportBundleRequest
@@ -1,57 +1,29 @@
 import os
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
 os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
 
 from fastapi.testclient import TestClient
 
 from main import app
-from modules.providers.amap.utils.transform_posi import wgs84_to_gcj02
-
-
-def _sample_wgs84_polygon():
-    lat = 31.2304
-    lon = 121.4737
-    d = 0.01
-    return [
-        [lon - d, lat - d],
-        [lon + d, lat - d],
-        [lon + d, lat + d],
-        [lon - d, lat + d],
-        [lon - d, lat - d],
-    ]
-
-
-def _sample_gcj02_polygon():
-    return [list(wgs84_to_gcj02(x, y)) for x, y in _sample_wgs84_polygon()]
+from h3_test_utils import build_gcj02_pois, fail_arcgis_bridge, pois_from_samples, sample_gcj02_polygon  # noqa: E402
 
 
-def _sample_pois_gcj02():
-    points_wgs84 = [
+_SAMPLE_POIS_GCJ02 = build_gcj02_pois(
+    [
         (121.4737, 31.2304, "050000"),
         (121.4742, 31.2306, "060000"),
         (121.4740, 31.2302, "150000"),
     ]
-    pois = []
-    for idx, (lng, lat, type_code) in enumerate(points_wgs84):
-        glng, glat = wgs84_to_gcj02(lng, lat)
-        pois.append(
-            {
-                "id": str(idx + 1),
-                "name": f"poi-{idx + 1}",
-                "location": [glng, glat],
-                "type": type_code,
-            }
-        )
-    return pois
+)
 
 
-def test_h3_metrics_api_shape():
-    client = TestClient(app)
+def _sample_pois_gcj02():
+    return pois_from_samples(_SAMPLE_POIS_GCJ02)
+
+
+def test_h3_metrics_api_shape(client):
     payload = {
-        "polygon": _sample_gcj02_polygon(),
+        "polygon": sample_gcj02_polygon(),
         "resolution": 10,
         "coord_type": "gcj02",
         "include_mode": "intersects",
@@ -76,10 +48,9 @@ def test_h3_metrics_api_shape():
     assert "arcgis_image_url_lisa" in data["summary"]
 
 
-def test_h3_metrics_poi_count_consistency():
-    client = TestClient(app)
+def test_h3_metrics_poi_count_consistency(client):
     payload = {
-        "polygon": _sample_gcj02_polygon(),
+        "polygon": sample_gcj02_polygon(),
         "resolution": 10,
         "coord_type": "gcj02",
         "include_mode": "intersects",
@@ -95,10 +66,9 @@ def test_h3_metrics_poi_count_consistency():
     assert assigned == data["summary"]["poi_count"]
 
 
-def test_h3_metrics_grid_count_changes_with_threshold():
-    client = TestClient(app)
+def test_h3_metrics_grid_count_changes_with_threshold(client):
     base_payload = {
-        "polygon": _sample_gcj02_polygon(),
+        "polygon": sample_gcj02_polygon(),
         "resolution": 10,
         "coord_type": "gcj02",
         "include_mode": "intersects",
@@ -115,10 +85,9 @@ def test_h3_metrics_grid_count_changes_with_threshold():
     assert strict_count <= loose_count
 
 
-def test_h3_metrics_spatial_structure_fields():
-    client = TestClient(app)
+def test_h3_metrics_spatial_structure_fields(client):
     payload = {
-        "polygon": _sample_gcj02_polygon(),
+        "polygon": sample_gcj02_polygon(),
         "resolution": 10,
         "coord_type": "gcj02",
         "include_mode": "intersects",
@@ -147,10 +116,9 @@ def test_h3_metrics_spatial_structure_fields():
     assert summary.get("lisa_render_meta", {}).get("mode") == "stddev"
 
 
-def test_h3_metrics_legacy_significance_payload_is_ignored():
-    client = TestClient(app)
+def test_h3_metrics_legacy_significance_payload_is_ignored(client):
     payload = {
-        "polygon": _sample_gcj02_polygon(),
+        "polygon": sample_gcj02_polygon(),
         "resolution": 10,
         "coord_type": "gcj02",
         "include_mode": "intersects",
@@ -172,10 +140,12 @@ def test_h3_metrics_legacy_significance_payload_is_ignored():
     assert all("spatial_structure_type" not in p for p in props_list)
 
 
-def test_h3_metrics_arcgis_failure_returns_502():
-    client = TestClient(app)
+def test_h3_metrics_arcgis_failure_returns_502(client, monkeypatch):
+    monkeypatch.setattr("modules.h3.analysis.run_h3_arcgis_analysis", fail_arcgis_bridge)
+    # Resolution 10 would go to the process pool, where the monkeypatch above does not apply.
+    monkeypatch.setattr("core.process_pool.settings.cpu_process_pool_enabled", False)
     payload = {
-        "polygon": _sample_gcj02_polygon(),
+        "polygon": sample_gcj02_polygon(),
         "resolution": 10,
         "coord_type": "gcj02",
         "include_mode": "intersects",
@@ -189,11 +159,10 @@ def test_h3_metrics_arcgis_failure_returns_502():
     resp = client.post("/api/v1/analysis/h3-metrics", json=payload)
     assert resp.status_code == 502
     body = resp.json()
-    assert "ArcGIS桥接失败" in str(body.get("detail") or "")
+    assert "bridge unavailable" in str(body.get("detail") or "")
 
 
-def test_h3_export_api_stream(monkeypatch):
-    client = TestClient(app)
+def test_h3_export_api_stream(client, monkeypatch):
 
     def _fake_export(**kwargs):
         assert kwargs.get("export_format") == "gpkg"
@@ -235,10 +204,10 @@ def test_h3_export_api_stream(monkeypatch):
 
 
 if __name__ == "__main__":
-    test_h3_metrics_api_shape()
-    test_h3_metrics_poi_count_consistency()
-    test_h3_metrics_grid_count_changes_with_threshold()
-    test_h3_metrics_spatial_structure_fields()
-    test_h3_metrics_legacy_significance_payload_is_ignored()
-    test_h3_metrics_arcgis_failure_returns_502()
+    client = TestClient(app)
+    test_h3_metrics_api_shape(client)
+    test_h3_metrics_poi_count_consistency(client)
+    test_h3_metrics_grid_count_changes_with_threshold(client)
+    test_h3_metrics_spatial_structure_fields(client)
+    test_h3_metrics_legacy_significance_payload_is_ignored(client)
     print("H3 analysis API tests passed.")
@@ -1,38 +1,16 @@
 import os
-import sys
-from pathlib import Path
 
-# Keep imports predictable in local runs
-sys.path.append(str(Path(__file__).resolve().parents[2]))
 os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
 
 from fastapi.testclient import TestClient
 
 from main import app
-from modules.providers.amap.utils.transform_posi import wgs84_to_gcj02
+from h3_test_utils import sample_gcj02_polygon, sample_wgs84_polygon  # noqa: E402
 
 
-def _sample_wgs84_polygon():
-    lat = 31.2304
-    lon = 121.4737
-    d = 0.01
-    return [
-        [lon - d, lat - d],
-        [lon + d, lat - d],
-        [lon + d, lat + d],
-        [lon - d, lat + d],
-        [lon - d, lat - d],
-    ]
-
-
-def _sample_gcj02_polygon():
-    return [list(wgs84_to_gcj02(x, y)) for x, y in _sample_wgs84_polygon()]
-
-
-def test_h3_grid_api_returns_feature_collection():
-    client = TestClient(app)
+def test_h3_grid_api_returns_feature_collection(client):
     payload = {
-        "polygon": _sample_gcj02_polygon(),
+        "polygon": sample_gcj02_polygon(),
         "resolution": 9,
         "coord_type": "gcj02",
         "include_mode": "intersects",
@@ -47,10 +25,9 @@ def test_h3_grid_api_returns_feature_collection():
     assert data["count"] > 0
 
 
-def test_h3_grid_api_supports_wgs84_input():
-    client = TestClient(app)
+def test_h3_grid_api_supports_wgs84_input(client):
     payload = {
-        "polygon": _sample_wgs84_polygon(),
+        "polygon": sample_wgs84_polygon(),
         "resolution": 9,
         "coord_type": "wgs84",
         "include_mode": "inside",
@@ -64,10 +41,9 @@ def test_h3_grid_api_supports_wgs84_input():
     assert data["count"] == len(data["features"])
 
 
-def test_h3_grid_api_overlap_ratio_filter():
-    client = TestClient(app)
+def test_h3_grid_api_overlap_ratio_filter(client):
     base_payload = {
-        "polygon": _sample_gcj02_polygon(),
+        "polygon": sample_gcj02_polygon(),
         "resolution": 10,
         "coord_type": "gcj02",
         "include_mode": "intersects",
@@ -84,7 +60,8 @@ def test_h3_grid_api_overlap_ratio_filter():
 
 
 if __name__ == "__main__":
-    test_h3_grid_api_returns_feature_collection()
-    test_h3_grid_api_supports_wgs84_input()
-    test_h3_grid_api_overlap_ratio_filter()
+    client = TestClient(app)
+    test_h3_grid_api_returns_feature_collection(client)
+    test_h3_grid_api_supports_wgs84_input(client)
+    test_h3_grid_api_overlap_ratio_filter(client)
     print("H3 API tests passed.")
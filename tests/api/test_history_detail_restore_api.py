@@ -1,13 +1,15 @@
 import asyncio
-import sys
-from pathlib import Path
+import os
 
 import pytest
 from fastapi import HTTPException
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
+os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
 
 import router.domains.history as history_module
+from main import app
 
 
 def test_get_history_detail_without_pois_returns_lightweight_payload(monkeypatch):
@@ -27,9 +29,9 @@ def test_get_history_detail_without_pois_returns_lightweight_payload(monkeypatch
             "poi_count": 2,
         } if include_pois is False else None,
     )
-    monkeypatch.setattr(history_module, "wgs84_to_gcj02", lambda x, y: (x + 0.5, y + 0.25))
+    monkeypatch.setattr(history_module, "wgs84_to_gcj02_arr", lambda x, y: (x + 0.5, y + 0.25))
 
-    response = asyncio.run(history_module.get_history_detail(7, include_pois=False))
+    response = TestClient(app).get("/api/v1/analysis/history/7", params={"include_pois": "false"}).json()
 
     assert response["id"] == 7
     assert "pois" not in response
@@ -54,9 +56,9 @@ def test_get_history_detail_with_pois_keeps_existing_contract(monkeypatch):
             "poi_count": 1,
         } if include_pois is True else None,
     )
-    monkeypatch.setattr(history_module, "wgs84_to_gcj02", lambda x, y: (x + 1.0, y + 2.0))
+    monkeypatch.setattr(history_module, "wgs84_to_gcj02_arr", lambda x, y: (x + 1.0, y + 2.0))
 
-    response = asyncio.run(history_module.get_history_detail(8, include_pois=True))
+    response = TestClient(app).get("/api/v1/analysis/history/8").json()
 
     assert response["pois"][0]["location"] == [31.0, 42.0]
     assert response["poi_count"] == 1
@@ -73,7 +75,7 @@ def test_get_history_pois_returns_poi_only_payload(monkeypatch):
             "count": 1,
         },
     )
-    monkeypatch.setattr(history_module, "wgs84_to_gcj02", lambda x, y: (x + 0.1, y + 0.2))
+    monkeypatch.setattr(history_module, "wgs84_to_gcj02_arr", lambda x, y: (x + 0.1, y + 0.2))
 
     response = asyncio.run(history_module.get_history_pois(11))
 
@@ -86,10 +88,56 @@ def test_get_history_detail_and_pois_raise_404_when_record_missing(monkeypatch):
     monkeypatch.setattr(history_module.history_repo, "get_detail", lambda history_id, include_pois=True: None)
     monkeypatch.setattr(history_module.history_repo, "get_pois", lambda history_id: None)
 
-    with pytest.raises(HTTPException) as detail_exc:
-        asyncio.run(history_module.get_history_detail(999, include_pois=False))
+    detail = TestClient(app).get("/api/v1/analysis/history/999", params={"include_pois": "false"})
     with pytest.raises(HTTPException) as pois_exc:
         asyncio.run(history_module.get_history_pois(999))
 
-    assert detail_exc.value.status_code == 404
+    assert detail.status_code == 404
     assert pois_exc.value.status_code == 404
+
+
+def test_get_history_detail_returns_304_for_matching_etag(monkeypatch):
+    from datetime import datetime
+
+    detail_calls = []
+
+    def fake_get_detail(history_id, include_pois=True):
+        detail_calls.append(history_id)
+        return {
+            "id": history_id,
+            "created_at": "2026-03-07T00:00:00Z",
+            "params": {"center": [10.0, 20.0]},
+            "polygon": [],
+            "poi_summary": {},
+            "poi_count": 0,
+        }
+
+    created_at_calls = []
+
+    def fake_get_created_at(history_id):
+        created_at_calls.append(history_id)
+        return datetime(2026, 3, 7)
+
+    monkeypatch.setattr(history_module.history_repo, "get_created_at", fake_get_created_at)
+    monkeypatch.setattr(history_module.history_repo, "get_detail", fake_get_detail)
+    client = TestClient(app)
+
+    first = client.get("/api/v1/analysis/history/9", params={"include_pois": "false"})
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    # Unconditional requests take the ETag from the payload without an extra lookup.
+    assert created_at_calls == []
+
+    cached = client.get(
+        "/api/v1/analysis/history/9",
+        params={"include_pois": "false"},
+        headers={"If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert detail_calls == [9]
+    assert created_at_calls == [9]
+
+    with_pois = client.get("/api/v1/analysis/history/9", headers={"If-None-Match": etag})
+    assert with_pois.status_code == 200
+    assert with_pois.headers["etag"] != etag
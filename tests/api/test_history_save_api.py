@@ -1,8 +1,4 @@
 import asyncio
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 import router.domains.history as history_module
 from modules.poi.schemas import HistorySaveRequest
@@ -11,7 +7,7 @@ from modules.poi.schemas import HistorySaveRequest
 def test_save_history_ignores_h3_and_road_snapshots(monkeypatch):
     captured = {}
 
-    monkeypatch.setattr(history_module, "gcj02_to_wgs84", lambda x, y: (x, y))
+    monkeypatch.setattr(history_module, "gcj02_to_wgs84_arr", lambda x, y: (x, y))
 
     def fake_create_record(params, polygon, pois, desc):
         captured["params"] = params
@@ -0,0 +1,32 @@
+import os
+
+os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+from shapely.geometry import Point, shape
+
+import modules.isochrone.service as isochrone_service
+from main import app
+
+
+def test_isochrone_api_returns_geojson_feature(monkeypatch):
+    monkeypatch.setattr(
+        isochrone_service,
+        "get_isochrone_polygon",
+        lambda lat, lon, time_sec, mode: Point(float(lon), float(lat)).buffer(0.001),
+    )
+    client = TestClient(app)
+
+    resp = client.post(
+        "/api/v1/analysis/isochrone",
+        json={"lat": 28.2282, "lon": 112.9388, "time_min": 15, "mode": "walking", "coord_type": "wgs84"},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    data = resp.json()
+    assert data["type"] == "Feature"
+    assert data["properties"]["center"] == [112.9388, 28.2282]
+    assert data["properties"]["origin_count"] == 1
+    assert data["geometry"]["type"] == "Polygon"
+    assert shape(data["geometry"]).covers(Point(112.9388, 28.2282))
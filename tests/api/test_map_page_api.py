@@ -0,0 +1,123 @@
+import os
+
+os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+
+import router.domains.system as system_router
+from main import app
+
+
+def test_map_page_streams_rendered_template(monkeypatch):
+    async def fake_run_db(func, *args, **kwargs):
+        return (
+            7,
+            {
+                "center": {"lng": 112.9388, "lat": 28.2282},
+                "radius": 500,
+                "points": [{"lng": 112.9388, "lat": 28.2282, "name": "五一广场"}],
+            },
+            None,
+        )
+
+    monkeypatch.setattr(system_router, "run_db", fake_run_db)
+    client = TestClient(app)
+
+    resp = client.get("/map", params={"type": "around", "location": "112.9388,28.2282"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/html")
+    assert "五一广场" in resp.text
+
+
+def test_map_page_returns_404_when_map_missing(monkeypatch):
+    async def fake_run_db(func, *args, **kwargs):
+        return None
+
+    monkeypatch.setattr(system_router, "run_db", fake_run_db)
+    client = TestClient(app)
+
+    resp = client.get("/map", params={"type": "around", "location": "112.9388,28.2282"})
+
+    assert resp.status_code == 404
+
+
+def test_favicon_serves_cached_bytes(monkeypatch):
+    monkeypatch.setattr(system_router, "_FAVICON_BYTES", b"\x00\x00\x01\x00")
+    client = TestClient(app)
+
+    resp = client.get("/favicon.ico")
+
+    assert resp.status_code == 200
+    assert resp.content == b"\x00\x00\x01\x00"
+    assert resp.headers["content-type"] == "image/x-icon"
+    assert resp.headers["cache-control"] == "public, max-age=86400"
+
+
+def test_health_body_is_reused_within_ttl():
+    client = TestClient(app)
+
+    first = client.get("/health")
+    second = client.get("/health")
+
+    assert first.status_code == 200
+    assert first.json()["status"] == "healthy"
+    assert second.content == first.content
+    assert client.get("/").json()["health"].endswith("/health")
+
+
+def test_map_xlsx_export_streams_whole_workbook(monkeypatch):
+    from io import BytesIO
+
+    import openpyxl
+
+    import router.domains.map as map_router
+    from modules.map_manage.schemas import MapRequest
+
+    points = [{"lng": 112.9388, "lat": 28.2282, "name": f"点\n{idx}"} for idx in range(3000)]
+
+    async def fake_load_map_request(map_id):
+        return MapRequest(center={"name": "五一广场"}, radius=500, points=points)
+
+    monkeypatch.setattr(map_router, "load_map_request", fake_load_map_request)
+    client = TestClient(app)
+
+    resp = client.get("/api/v1/maps/7/export/xlsx")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-disposition"] == 'attachment; filename="map_7_data.xlsx"'
+    ws = openpyxl.load_workbook(BytesIO(resp.content)).active
+    assert ws.max_row == len(points) + 1
+    assert ws.cell(row=len(points) + 1, column=1).value == "点\n2999"
+
+
+def test_generate_map_keeps_client_place_types_in_url(monkeypatch):
+    import asyncio
+    import json
+    from urllib.parse import parse_qs, urlparse
+
+    import router.domains.map as map_router
+    from modules.providers.amap.schemas import MapGenerateRequest
+
+    center = {"lng": 112.9388, "lat": 28.2282}
+    body = {"center": center, "radius": 500, "points": [{"lng": 112.9388, "lat": 28.2282, "name": "五一广场"}]}
+    looked_up = []
+
+    def fake_generate_map_json(**kwargs):
+        assert kwargs["pre_points_hook"](center, "around") == (3, body)
+        return {"body": body}, 3
+
+    def fake_find(fingerprint):
+        looked_up.append(fingerprint)
+        return 3, body, None
+
+    monkeypatch.setattr(map_router, "generate_map_json", fake_generate_map_json)
+    monkeypatch.setattr(map_router, "find_map_by_fingerprint", fake_find)
+    request = MapGenerateRequest(place="长沙", type="around", year=2025, place_types=["咖啡", "便利店", "咖啡"])
+
+    response = asyncio.run(map_router.generate_map(request, True))
+
+    assert response.status == 200
+    query = parse_qs(urlparse(response.url).query)
+    assert json.loads(query["place_types"][0]) == ["咖啡", "便利店", "咖啡"]
+    assert looked_up == [map_router.build_center_fingerprint(center, "around", ("便利店", "咖啡"), "gaode", 2025)]
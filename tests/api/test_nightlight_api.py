@@ -1,10 +1,6 @@
 import asyncio
 import os
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
 
 import httpx  # noqa: E402
@@ -1,12 +1,10 @@
 import os
-import sys
 import base64
 from pathlib import Path
 import asyncio
 
 import numpy as np
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
 os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
 
 import httpx
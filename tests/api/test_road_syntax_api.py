@@ -1,10 +1,7 @@
 import os
-import sys
-from pathlib import Path
 
 from fastapi.testclient import TestClient
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
 os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
 
 from main import app
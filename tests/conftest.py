@@ -1,6 +1,13 @@
 import inspect
+import os
 
 import httpx
+import pytest
+
+# Set before any test module imports core.config, so every worker process sees it too.
+os.environ.setdefault("AMAP_JS_API_KEY", "test-key")
+# Keep CPU-bound work in-process so monkeypatches reach it and no app-importing workers are spawned.
+os.environ.setdefault("CPU_PROCESS_POOL_ENABLED", "0")
 
 
 def _patch_httpx_testclient_compat() -> None:
@@ -16,3 +23,13 @@ def _patch_httpx_testclient_compat() -> None:
 
 
 _patch_httpx_testclient_compat()
+
+
+@pytest.fixture(scope="session")
+def client():
+    # One TestClient for the whole session; lifespan is not entered, same as the per-test clients it replaces.
+    from fastapi.testclient import TestClient
+
+    from main import app
+
+    return TestClient(app)
@@ -1,11 +1,6 @@
-from pathlib import Path
-import sys
-
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 import store.agent_session_repo as agent_session_repo_module
 from store.agent_session_repo import AgentSessionRepo
 from store.models import AgentSession, Base
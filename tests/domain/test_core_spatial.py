@@ -1,16 +1,20 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 from core.spatial import (
+    apply_batch_transform,
     build_scope_id,
+    copy_nested_coord_points,
+    convert_geometry,
+    convert_geometry_arr,
     pick_largest_polygon,
     polygon_from_payload,
     to_wgs84_geometry,
     transform_polygon_payload_coords,
 )
-from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84, wgs84_to_gcj02
+from modules.providers.amap.utils.transform_posi import (
+    gcj02_to_wgs84,
+    gcj02_to_wgs84_arr,
+    wgs84_to_gcj02,
+    wgs84_to_gcj02_arr,
+)
 
 
 def _sample_wgs84_ring():
@@ -67,6 +71,36 @@ def test_to_wgs84_geometry_round_trip_from_gcj02_polygon():
     assert geom.symmetric_difference(expected).area < 1e-8
 
 
+def test_convert_geometry_maps_every_vertex_and_keeps_parts():
+    small_ring = [
+        [121.470, 31.240],
+        [121.478, 31.240],
+        [121.478, 31.232],
+        [121.470, 31.232],
+        [121.470, 31.240],
+    ]
+    geom = polygon_from_payload([[_sample_wgs84_ring()], [small_ring]])
+
+    converted = convert_geometry(geom, wgs84_to_gcj02)
+
+    assert converted.geom_type == "MultiPolygon"
+    assert len(converted.geoms) == 2
+    for original, result in zip(geom.geoms, converted.geoms):
+        for (lng, lat), (tlng, tlat) in zip(original.exterior.coords, result.exterior.coords):
+            assert (tlng, tlat) == wgs84_to_gcj02(lng, lat)
+    assert convert_geometry(polygon_from_payload([]), wgs84_to_gcj02).is_empty
+
+
+def test_convert_geometry_arr_matches_scalar_converter():
+    geom = polygon_from_payload(_sample_wgs84_ring()).buffer(0.001)
+
+    vectorized = convert_geometry_arr(geom, wgs84_to_gcj02_arr)
+    scalar = convert_geometry(geom, wgs84_to_gcj02)
+
+    assert vectorized.equals_exact(scalar, 0.0)
+    assert geom.exterior.coords[0] != vectorized.exterior.coords[0]
+
+
 def test_transform_polygon_payload_coords_preserves_nested_shape():
     nested = [[_sample_gcj02_ring()]]
 
@@ -90,3 +124,19 @@ def test_build_scope_id_is_stable_for_same_geometry_and_parts():
     assert scope_a == scope_b
     assert scope_a != scope_c
     assert len(scope_a) == 24
+
+
+def test_batch_coord_transform_matches_scalar_conversion():
+    nested = [[_sample_gcj02_ring()], [[[2.35, 48.85], [2.36, 48.86], [2.35, 48.86], [2.35, 48.85]]]]
+    points = []
+
+    copied = copy_nested_coord_points(nested, points)
+    apply_batch_transform(points, gcj02_to_wgs84_arr)
+
+    assert len(points) == 9
+    assert copied[0][0][0] == list(gcj02_to_wgs84(*nested[0][0][0]))
+    assert copied[1][0][0] == [2.35, 48.85]
+    assert nested[0][0][0] == _sample_gcj02_ring()[0]
+    lngs, lats = wgs84_to_gcj02_arr([121.462, 200.0], [31.248, 31.248])
+    assert (lngs[0], lats[0]) == wgs84_to_gcj02(121.462, 31.248)
+    assert (lngs[1], lats[1]) == (200.0, 31.248)
@@ -1,11 +1,3 @@
-
-import sys
-import os
-from pathlib import Path
-
-# Add project root to sys.path
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 from modules.h3.core import polygon_to_hexagons, get_hexagon_boundary
 from modules.providers.amap.utils.transform_posi import wgs84_to_gcj02
 from shapely.geometry import Polygon, Point
@@ -1,53 +1,24 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
-from modules.providers.amap.utils.transform_posi import wgs84_to_gcj02
+from h3_test_utils import build_gcj02_pois, fail_arcgis_bridge, pois_from_samples, sample_gcj02_polygon
 from modules.h3.analysis import analyze_h3_grid
 
 
-def _sample_wgs84_polygon():
-    lat = 31.2304
-    lon = 121.4737
-    d = 0.01
-    return [
-        [lon - d, lat - d],
-        [lon + d, lat - d],
-        [lon + d, lat + d],
-        [lon - d, lat + d],
-        [lon - d, lat - d],
-    ]
-
-
-def _sample_gcj02_polygon():
-    return [list(wgs84_to_gcj02(x, y)) for x, y in _sample_wgs84_polygon()]
-
-
-def _sample_pois_gcj02():
-    points_wgs84 = [
+_SAMPLE_POIS_GCJ02 = build_gcj02_pois(
+    [
         (121.4737, 31.2304, "050000"),  # dining
         (121.4742, 31.2306, "050000"),  # dining
         (121.4740, 31.2302, "060000"),  # shopping
         (121.4734, 31.2299, "150000"),  # transport
     ]
-    pois = []
-    for idx, (lng, lat, type_code) in enumerate(points_wgs84):
-        glng, glat = wgs84_to_gcj02(lng, lat)
-        pois.append(
-            {
-                "id": str(idx + 1),
-                "name": f"poi-{idx + 1}",
-                "location": [glng, glat],
-                "type": type_code,
-            }
-        )
-    return pois
+)
+
+
+def _sample_pois_gcj02():
+    return pois_from_samples(_SAMPLE_POIS_GCJ02)
 
 
 def test_poi_count_consistency():
     result = analyze_h3_grid(
-        polygon=_sample_gcj02_polygon(),
+        polygon=sample_gcj02_polygon(),
         resolution=10,
         coord_type="gcj02",
         include_mode="intersects",
@@ -64,7 +35,7 @@ def test_poi_count_consistency():
 def test_single_category_entropy_zero():
     one_poi = [_sample_pois_gcj02()[0]]
     result = analyze_h3_grid(
-        polygon=_sample_gcj02_polygon(),
+        polygon=sample_gcj02_polygon(),
         resolution=10,
         coord_type="gcj02",
         include_mode="intersects",
@@ -81,7 +52,7 @@ def test_single_category_entropy_zero():
 
 def test_empty_poi_input():
     result = analyze_h3_grid(
-        polygon=_sample_gcj02_polygon(),
+        polygon=sample_gcj02_polygon(),
         resolution=10,
         coord_type="gcj02",
         include_mode="intersects",
@@ -97,7 +68,7 @@ def test_empty_poi_input():
 
 def test_neighbor_metrics_fields_exist():
     result = analyze_h3_grid(
-        polygon=_sample_gcj02_polygon(),
+        polygon=sample_gcj02_polygon(),
         resolution=10,
         coord_type="gcj02",
         include_mode="intersects",
@@ -115,7 +86,7 @@ def test_neighbor_metrics_fields_exist():
 
 def test_moran_i_is_none_or_finite():
     result = analyze_h3_grid(
-        polygon=_sample_gcj02_polygon(),
+        polygon=sample_gcj02_polygon(),
         resolution=10,
         coord_type="gcj02",
         include_mode="intersects",
@@ -130,7 +101,7 @@ def test_moran_i_is_none_or_finite():
 
 def test_spatial_structure_fields_exist():
     result = analyze_h3_grid(
-        polygon=_sample_gcj02_polygon(),
+        polygon=sample_gcj02_polygon(),
         resolution=10,
         coord_type="gcj02",
         include_mode="intersects",
@@ -162,7 +133,7 @@ def test_spatial_structure_fields_exist():
 
 def test_summary_contains_descriptive_render_meta():
     result = analyze_h3_grid(
-        polygon=_sample_gcj02_polygon(),
+        polygon=sample_gcj02_polygon(),
         resolution=10,
         coord_type="gcj02",
         include_mode="intersects",
@@ -182,10 +153,11 @@ def test_summary_contains_descriptive_render_meta():
     assert "message" in lisa_meta
 
 
-def test_analyze_h3_grid_arcgis_failure_raises():
+def test_analyze_h3_grid_arcgis_failure_raises(monkeypatch):
+    monkeypatch.setattr("modules.h3.analysis.run_h3_arcgis_analysis", fail_arcgis_bridge)
     try:
         analyze_h3_grid(
-            polygon=_sample_gcj02_polygon(),
+            polygon=sample_gcj02_polygon(),
             resolution=10,
             coord_type="gcj02",
             include_mode="intersects",
@@ -212,3 +184,18 @@ if __name__ == "__main__":
     test_summary_contains_descriptive_render_meta()
     test_analyze_h3_grid_arcgis_failure_raises()
     print("H3 analysis core tests passed.")
+
+
+def test_extract_outer_ring_drops_non_finite_vertices_on_both_paths():
+    from modules.h3.arcgis_bridge import _extract_outer_ring
+
+    def feature(ring):
+        return {"geometry": {"type": "Polygon", "coordinates": [ring]}}
+
+    inf = float("inf")
+    # Rectangular ring -> numpy path; ragged ring -> per-vertex fallback.
+    fast = _extract_outer_ring(feature([[1.0, 2.0], [inf, 3.0], [float("nan"), 4.0], [5.0, -inf], [6.0, 7.0]]))
+    slow = _extract_outer_ring(feature([[1.0, 2.0], [inf, 3.0], [float("nan"), 4.0], [5.0, -inf], [6.0, 7.0, 0.0], "bad"]))
+
+    assert fast == [[1.0, 2.0], [6.0, 7.0]]
+    assert slow == fast
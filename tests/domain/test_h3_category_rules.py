@@ -1,8 +1,3 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 from modules.h3.category_rules import CATEGORY_KEYS, empty_category_counts, infer_category_key, normalize_typecode
 
 
@@ -1,43 +1,22 @@
-import sys
-from pathlib import Path
-
-# Add project root to sys.path
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
-from shapely.geometry import Polygon
+import numpy as np
+import shapely
 
 from modules.h3.core import build_h3_grid_feature_collection
-from modules.providers.amap.utils.transform_posi import wgs84_to_gcj02
-
-
-def _sample_wgs84_polygon():
-    lat = 31.2304
-    lon = 121.4737
-    d = 0.01
-    return [
-        [lon - d, lat - d],
-        [lon + d, lat - d],
-        [lon + d, lat + d],
-        [lon - d, lat + d],
-        [lon - d, lat - d],
-    ]
-
-
-def _sample_gcj02_polygon():
-    return [list(wgs84_to_gcj02(x, y)) for x, y in _sample_wgs84_polygon()]
+from h3_test_utils import sample_gcj02_polygon, sample_wgs84_polygon
 
 
 def test_grid_feature_collection_non_empty():
-    fc = build_h3_grid_feature_collection(_sample_gcj02_polygon(), resolution=9, coord_type="gcj02")
+    fc = build_h3_grid_feature_collection(sample_gcj02_polygon(), resolution=9, coord_type="gcj02")
     assert fc["type"] == "FeatureCollection"
     assert fc["count"] > 0
     assert len(fc["features"]) == fc["count"]
 
 
 def test_grid_features_have_valid_shape_and_properties():
-    fc = build_h3_grid_feature_collection(_sample_gcj02_polygon(), resolution=9, coord_type="gcj02")
+    fc = build_h3_grid_feature_collection(sample_gcj02_polygon(), resolution=9, coord_type="gcj02")
     assert fc["count"] > 0
 
+    rings = []
     for feat in fc["features"]:
         assert feat["type"] == "Feature"
         assert feat["properties"]["h3_id"]
@@ -47,21 +26,26 @@ def test_grid_features_have_valid_shape_and_properties():
         assert geometry["type"] == "Polygon"
         ring = geometry["coordinates"][0]
         assert len(ring) >= 4
+        rings.append(ring)
 
-        poly = Polygon(ring)
-        assert not poly.is_empty
-        assert poly.is_valid
+    # Build every cell polygon in one vectorized call instead of one Polygon() per cell
+    ring_lengths = [len(ring) for ring in rings]
+    coords = np.concatenate([np.asarray(ring, dtype=np.float64) for ring in rings])
+    indices = np.repeat(np.arange(len(rings)), ring_lengths)
+    polys = shapely.polygons(shapely.linearrings(coords, indices=indices))
+    assert not shapely.is_empty(polys).any()
+    assert shapely.is_valid(polys).all()
 
 
 def test_inside_mode_not_more_than_intersects():
     intersects_fc = build_h3_grid_feature_collection(
-        _sample_gcj02_polygon(),
+        sample_gcj02_polygon(),
         resolution=9,
         coord_type="gcj02",
         include_mode="intersects",
     )
     inside_fc = build_h3_grid_feature_collection(
-        _sample_gcj02_polygon(),
+        sample_gcj02_polygon(),
         resolution=9,
         coord_type="gcj02",
         include_mode="inside",
@@ -71,14 +55,14 @@ def test_inside_mode_not_more_than_intersects():
 
 def test_higher_overlap_ratio_reduces_or_equals_count():
     loose_fc = build_h3_grid_feature_collection(
-        _sample_gcj02_polygon(),
+        sample_gcj02_polygon(),
         resolution=10,
         coord_type="gcj02",
         include_mode="intersects",
         min_overlap_ratio=0.0,
     )
     strict_fc = build_h3_grid_feature_collection(
-        _sample_gcj02_polygon(),
+        sample_gcj02_polygon(),
         resolution=10,
         coord_type="gcj02",
         include_mode="intersects",
@@ -88,7 +72,7 @@ def test_higher_overlap_ratio_reduces_or_equals_count():
 
 
 def test_wgs84_input_supported():
-    fc = build_h3_grid_feature_collection(_sample_wgs84_polygon(), resolution=9, coord_type="wgs84")
+    fc = build_h3_grid_feature_collection(sample_wgs84_polygon(), resolution=9, coord_type="wgs84")
     assert fc["type"] == "FeatureCollection"
     assert fc["count"] > 0
 
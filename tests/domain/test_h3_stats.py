@@ -1,8 +1,3 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 from modules.h3.stats import build_lisa_render_meta, calc_continuous_stats, shannon_entropy
 
 
@@ -1,11 +1,6 @@
-from pathlib import Path
-import sys
-
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 import store.history_repo as history_repo_module
 from store.history_repo import HistoryRepo
 from store.models import AnalysisHistory, Base, PoiResult
@@ -106,3 +101,112 @@ def test_get_list_dedupes_using_lightweight_sidebar_fields(monkeypatch):
     records = repo.get_list()
 
     assert len(records) == 1
+
+
+def test_delete_record_cascades_poi_results_via_foreign_key(monkeypatch):
+    from sqlalchemy import event, select
+
+    from store.database import _apply_sqlite_pragmas
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(history_repo_module, "SessionLocal", TestingSessionLocal)
+
+    repo = HistoryRepo()
+    params = {"center": [112.9388, 28.2282], "time_min": 15, "mode": "walking"}
+    ring = [[112.9, 28.2], [113.0, 28.3], [112.9, 28.2]]
+    repo.create_record(params, ring, [{"id": "p0", "type": "咖啡"}])
+    history_id = repo.create_record(params, ring, [{"id": "p1", "type": "咖啡"}])
+
+    session = TestingSessionLocal()
+    try:
+        assert session.scalars(select(PoiResult.history_id)).all() == [history_id]
+    finally:
+        session.close()
+
+    assert repo.delete_record(history_id) is True
+
+    session = TestingSessionLocal()
+    try:
+        assert session.scalars(select(PoiResult.id)).all() == []
+    finally:
+        session.close()
+
+
+def test_delete_and_overwrite_remove_poi_results_without_foreign_keys(monkeypatch):
+    from sqlalchemy import select
+
+    # No PRAGMA listener: foreign keys stay off, as on legacy or ad-hoc engines.
+    engine = create_engine("sqlite:///:memory:", future=True)
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(history_repo_module, "SessionLocal", TestingSessionLocal)
+
+    repo = HistoryRepo()
+    params = {"center": [112.9388, 28.2282], "time_min": 15, "mode": "walking"}
+    ring = [[112.9, 28.2], [113.0, 28.3], [112.9, 28.2]]
+    repo.create_record(params, ring, [{"id": "p0", "type": "咖啡"}])
+    history_id = repo.create_record(params, ring, [{"id": "p1", "type": "咖啡"}])
+
+    session = TestingSessionLocal()
+    try:
+        assert session.scalars(select(PoiResult.history_id)).all() == [history_id]
+    finally:
+        session.close()
+
+    assert repo.delete_record(history_id) is True
+
+    session = TestingSessionLocal()
+    try:
+        assert session.scalars(select(PoiResult.id)).all() == []
+    finally:
+        session.close()
+
+
+def test_get_detail_joins_poi_result_in_single_query(monkeypatch):
+    from sqlalchemy import event
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(history_repo_module, "SessionLocal", TestingSessionLocal)
+
+    repo = HistoryRepo()
+    history_id = repo.create_record(
+        {"center": [112.9388, 28.2282], "time_min": 15, "mode": "walking"},
+        [[112.9, 28.2], [113.0, 28.3], [112.9, 28.2]],
+        [{"id": "p1", "type": "咖啡"}, {"id": "p2", "type": "咖啡"}],
+    )
+    bare_id = repo.create_record({"center": [113.0, 28.0], "time_min": 5, "mode": "driving"}, [], [])
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    detail = repo.get_detail(history_id)
+    assert len(statements) == 1
+    assert [poi["id"] for poi in detail["pois"]] == ["p1", "p2"]
+
+    summary_only = repo.get_detail(history_id, include_pois=False)
+    assert summary_only["poi_count"] == 2
+    assert summary_only["poi_summary"] == {"咖啡": 2, "total": 2}
+    assert "pois" not in summary_only
+
+    assert repo.get_detail(bare_id)["pois"] == []
+    assert repo.get_detail(404) is None
+
+
+def test_json_serializer_keeps_non_finite_floats():
+    import math
+
+    from store.database import _json_deserializer, _json_serializer
+
+    text = _json_serializer({"h3_result": {"gi_z": [1.5, float("nan")], "max": float("inf")}, "note": None})
+
+    assert "NaN" in text and "Infinity" in text
+    restored = _json_deserializer(text)
+    assert math.isnan(restored["h3_result"]["gi_z"][1])
+    assert restored["h3_result"]["max"] == math.inf
+    assert restored["note"] is None
+    assert _json_serializer({"a": [1, None], "b": "中文"}) == '{"a":[1,null],"b":"中文"}'
@@ -1,8 +1,3 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 import modules.history.service as history_service
 
 
@@ -19,7 +14,7 @@ def test_history_keys_are_stable_for_equivalent_params():
 
 
 def test_convert_history_detail_to_gcj02_restores_center_polygon_and_pois(monkeypatch):
-    monkeypatch.setattr(history_service, "wgs84_to_gcj02", lambda x, y: (x + 0.1, y + 0.2))
+    monkeypatch.setattr(history_service, "wgs84_to_gcj02_arr", lambda x, y: (x + 0.1, y + 0.2))
     payload = {
         "params": {
             "center": [100.0, 20.0],
@@ -33,3 +28,33 @@ def test_convert_history_detail_to_gcj02_restores_center_polygon_and_pois(monkey
     assert result["params"]["drawn_polygon"][0] == [100.1, 20.2]
     assert result["polygon"][0] == [100.1, 20.2]
     assert result["pois"][0]["location"] == [100.3, 20.4]
+
+
+def test_save_history_request_converts_polygon_and_pois_to_wgs84(monkeypatch):
+    from modules.poi.schemas import HistorySaveRequest
+    from modules.providers.amap.utils.transform_posi import gcj02_to_wgs84, gcj02_to_wgs84_arr
+
+    # 路由层会把转换函数同步到 service，这里固定为真实实现，避免受其他测试的替身影响
+    monkeypatch.setattr(history_service, "gcj02_to_wgs84_arr", gcj02_to_wgs84_arr)
+    captured = {}
+
+    class FakeRepo:
+        def create_record(self, params, polygon, pois, description=""):
+            captured.update(params=params, polygon=polygon, pois=pois)
+            return 1
+
+    ring = [[112.9, 28.2], [113.0, 28.2], [113.0, 28.3], [112.9, 28.2]]
+    payload = HistorySaveRequest(
+        center=[112.95, 28.25],
+        polygon=ring,
+        pois=[{"id": "p1", "location": [112.96, 28.26]}, {"id": "p2"}],
+    )
+
+    history_service.save_history_request(payload, FakeRepo())
+
+    assert captured["params"]["center"] == list(gcj02_to_wgs84(112.95, 28.25))
+    assert captured["polygon"][1] == list(gcj02_to_wgs84(113.0, 28.2))
+    assert captured["pois"][0]["location"] == list(gcj02_to_wgs84(112.96, 28.26))
+    assert captured["pois"][1] == {"id": "p2"}
+    assert payload.pois[0]["location"] == [112.96, 28.26]
+    assert payload.polygon[1] == [113.0, 28.2]
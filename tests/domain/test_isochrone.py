@@ -1,11 +1,3 @@
-
-import sys
-import os
-from pathlib import Path
-
-# Add project root to sys.path
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 from modules.isochrone import get_isochrone_polygon
 from shapely.geometry import Polygon
 
@@ -0,0 +1,71 @@
+import openpyxl
+
+from modules.map_manage.schemas import MapRequest
+from utils.exporter import HEADERS, export_map_to_xlsx
+
+
+def _sample_request():
+    return MapRequest(
+        center={"name": "中心 <&>", "lng": 112.9, "lat": 28.2},
+        radius=500,
+        points=[
+            {
+                "lng": 112.91,
+                "lat": 28.21,
+                "name": "A&B <x>",
+                "type": "type-170000",
+                "lines": ["1路", "2路"],
+                "distance": 12,
+            },
+            {"lng": 112.95, "lat": 28.25, "name": "C", "type": "other"},
+        ],
+    )
+
+
+def test_export_map_to_xlsx_roundtrips_through_openpyxl():
+    filename, buffer = export_map_to_xlsx(_sample_request(), 7)
+
+    assert filename == "map_7_data.xlsx"
+    wb = openpyxl.load_workbook(buffer)
+    assert wb.sheetnames == ["地图数据"]
+    rows = list(wb.active.iter_rows(values_only=True))
+    assert rows[0] == tuple(HEADERS)
+    assert rows[1] == ("A&B <x>", "170000", "公司", "公司企业", 112.91, 28.21, 12, "1路 / 2路", "中心 <&>", 500)
+    # Empty cells must not shift later columns to the left.
+    assert rows[2] == ("C", "other", None, None, 112.95, 28.25, None, None, "中心 <&>", 500)
+
+
+def test_export_map_to_xlsx_can_skip_compression(monkeypatch):
+    from zipfile import ZIP_STORED, ZipFile
+
+    import utils.exporter as exporter_module
+
+    monkeypatch.setattr(exporter_module.settings, "xlsx_compress", False)
+    _, buffer = export_map_to_xlsx(_sample_request())
+
+    with ZipFile(buffer) as zf:
+        assert {info.compress_type for info in zf.infolist()} == {ZIP_STORED}
+    buffer.seek(0)
+    assert openpyxl.load_workbook(buffer).active.max_row == 3
+
+
+def test_write_xlsx_keeps_numpy_scalars_numeric():
+    import io
+
+    import numpy as np
+
+    from utils.xlsx_fast import write_xlsx
+
+    buffer = io.BytesIO()
+    write_xlsx(
+        buffer,
+        "sheet",
+        ["float", "int", "nan", "bool"],
+        [[np.float64(1.5), np.int64(7), np.float32("nan"), True], [np.float32(0.25), np.int32(-3), None, False]],
+    )
+
+    buffer.seek(0)
+    rows = list(openpyxl.load_workbook(buffer).active.iter_rows(values_only=True))
+    assert rows[1] == (1.5, 7, None, True)
+    assert rows[2] == (0.25, -3, None, False)
+    assert isinstance(rows[1][1], int)
@@ -0,0 +1,230 @@
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import store.map_repo as map_repo_module
+import store.polygon_repo as polygon_repo_module
+from store.fingerprint import build_center_fingerprint
+from store.models import Base
+
+
+def _install_repos(monkeypatch):
+    engine = create_engine("sqlite:///:memory:", future=True)
+    testing_session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(map_repo_module, "SessionLocal", testing_session_local)
+    monkeypatch.setattr(polygon_repo_module, "SessionLocal", testing_session_local)
+    return testing_session_local
+
+
+def _save_sample_map() -> int:
+    return map_repo_module.save_map_data(
+        {"center": {"lng": 112.9388, "lat": 28.2282}, "points": []},
+        {"lng": 112.9388, "lat": 28.2282},
+        "around",
+        ("咖啡",),
+        "gaode",
+        2025,
+    )
+
+
+def test_polygon_crud_reports_missing_map_without_separate_lookup(monkeypatch):
+    _install_repos(monkeypatch)
+
+    assert polygon_repo_module.list_polygons_for_map(404) is None
+    assert polygon_repo_module.save_polygon(404, [[112.9, 28.2], [113.0, 28.3], [112.9, 28.2]]) is None
+
+    map_id = _save_sample_map()
+    assert polygon_repo_module.list_polygons_for_map(map_id) == []
+
+    ring = [[112.9, 28.2], [113.0, 28.3], [113.0, 28.2], [112.9, 28.2]]
+    polygon_id = polygon_repo_module.save_polygon(map_id, ring)
+    assert polygon_repo_module.list_polygons_for_map(map_id) == [{"id": polygon_id, "coordinates": ring}]
+
+    assert polygon_repo_module.delete_polygon(map_id, polygon_id) is True
+    assert polygon_repo_module.delete_polygon(map_id, polygon_id) is False
+    assert polygon_repo_module.list_polygons_for_map(map_id) == []
+
+
+def test_save_polygon_for_missing_map_leaves_no_orphan_polygon(monkeypatch):
+    session_local = _install_repos(monkeypatch)
+    ring = [[112.9, 28.2], [113.0, 28.3], [113.0, 28.2], [112.9, 28.2]]
+
+    assert polygon_repo_module.save_polygon(404, ring) is None
+
+    session = session_local()
+    polygon_ids = session.scalars(map_repo_module.select(map_repo_module.PolygonData.id)).all()
+    link_ids = session.scalars(map_repo_module.select(map_repo_module.MapPolygonLink.id)).all()
+    session.close()
+    assert polygon_ids == []
+    assert link_ids == []
+
+    map_id = _save_sample_map()
+    polygon_id = polygon_repo_module.save_polygon(map_id, ring)
+    assert polygon_repo_module.list_polygons_for_map(map_id) == [{"id": polygon_id, "coordinates": ring}]
+
+
+def test_center_fingerprint_keeps_stored_canonical_json_format():
+    fingerprint = build_center_fingerprint(
+        {"lng": 112.9388, "lat": 28.2282, "name": "五一广场"},
+        " around ",
+        ("咖啡", "", "便利店", "咖啡"),
+        "gaode",
+        2025,
+    )
+
+    assert fingerprint == json.dumps(
+        {
+            "lng": 112.9388,
+            "lat": 28.2282,
+            "type": "around",
+            "place_types": ["便利店", "咖啡"],
+            "source": "gaode",
+            "year": 2025,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def test_cached_fingerprint_lookup_is_invalidated_by_writes(monkeypatch):
+    _install_repos(monkeypatch)
+    map_repo_module.clear_map_lookup_cache()
+    fingerprint = build_center_fingerprint({"lng": 112.9388, "lat": 28.2282}, "around", ("咖啡",), "gaode", 2025)
+
+    assert map_repo_module.find_map_by_fingerprint_cached(fingerprint) is None
+    map_id = _save_sample_map()
+    cached = map_repo_module.find_map_by_fingerprint_cached(fingerprint)
+    assert cached[0] == map_id
+
+    calls = []
+    original_lookup = map_repo_module.find_map_by_fingerprint
+    monkeypatch.setattr(
+        map_repo_module,
+        "find_map_by_fingerprint",
+        lambda fp: calls.append(fp) or original_lookup(fp),
+    )
+    assert map_repo_module.find_map_by_fingerprint_cached(fingerprint) == cached
+    assert calls == []
+
+    assert map_repo_module.delete_map(map_id) is True
+    assert map_repo_module.find_map_by_fingerprint_cached(fingerprint) is None
+    assert calls == [fingerprint]
+
+
+def test_cached_fingerprint_lookup_does_not_cache_misses(monkeypatch):
+    _install_repos(monkeypatch)
+    map_repo_module.clear_map_lookup_cache()
+    fingerprint = build_center_fingerprint({"lng": 112.9388, "lat": 28.2282}, "around", ("咖啡",), "gaode", 2025)
+
+    assert map_repo_module.find_map_by_fingerprint_cached(fingerprint) is None
+    # Simulate a write from another process: no in-process invalidation happens.
+    monkeypatch.setattr(map_repo_module, "clear_map_lookup_cache", lambda: None)
+    map_id = _save_sample_map()
+
+    cached = map_repo_module.find_map_by_fingerprint_cached(fingerprint)
+    assert cached is not None
+    assert cached[0] == map_id
+
+
+def test_delete_map_removes_only_orphaned_polygons(monkeypatch):
+    session_local = _install_repos(monkeypatch)
+    ring = [[112.9, 28.2], [113.0, 28.3], [113.0, 28.2], [112.9, 28.2]]
+    map_id = _save_sample_map()
+    other_map_id = map_repo_module.save_map_data({"points": []}, {"lng": 113.0, "lat": 28.0}, "around")
+    shared_id = polygon_repo_module.save_polygon(map_id, ring)
+    orphan_id = polygon_repo_module.save_polygon(map_id, ring)
+    session = session_local()
+    session.add(map_repo_module.MapPolygonLink(map_id=other_map_id, polygon_id=shared_id))
+    session.commit()
+    session.close()
+
+    assert map_repo_module.delete_map(map_id) is True
+
+    session = session_local()
+    remaining = set(session.scalars(map_repo_module.select(map_repo_module.PolygonData.id)).all())
+    session.close()
+    assert remaining == {shared_id}
+    assert orphan_id not in remaining
+    assert polygon_repo_module.list_polygons_for_map(other_map_id) == [{"id": shared_id, "coordinates": ring}]
+
+
+def test_delete_missing_map_leaves_dangling_links_untouched(monkeypatch):
+    session_local = _install_repos(monkeypatch)
+    ring = [[112.9, 28.2], [113.0, 28.3], [113.0, 28.2], [112.9, 28.2]]
+    map_id = _save_sample_map()
+    polygon_id = polygon_repo_module.save_polygon(map_id, ring)
+    # Legacy databases may hold links whose map row is already gone.
+    session = session_local()
+    session.add(map_repo_module.MapPolygonLink(map_id=9999, polygon_id=polygon_id))
+    session.commit()
+    session.close()
+
+    assert map_repo_module.delete_map(9999) is False
+
+    session = session_local()
+    linked_maps = session.scalars(
+        map_repo_module.select(map_repo_module.MapPolygonLink.map_id).where(
+            map_repo_module.MapPolygonLink.polygon_id == polygon_id
+        )
+    ).all()
+    session.close()
+    assert sorted(linked_maps) == [map_id, 9999]
+
+
+def test_list_maps_with_polygons_preloads_ordered_polygons(monkeypatch):
+    _install_repos(monkeypatch)
+    ring = [[112.9, 28.2], [113.0, 28.3], [113.0, 28.2], [112.9, 28.2]]
+    map_id = _save_sample_map()
+    empty_map_id = map_repo_module.save_map_data({"points": []}, {"lng": 113.0, "lat": 28.0}, "around")
+    first_id = polygon_repo_module.save_polygon(map_id, ring)
+    second_id = polygon_repo_module.save_polygon(map_id, ring[::-1])
+
+    records = {record["id"]: record for record in map_repo_module.list_maps_with_polygons()}
+
+    assert set(records) == {map_id, empty_map_id}
+    assert [item["id"] for item in records[map_id]["polygons"]] == [first_id, second_id]
+    assert records[map_id]["polygons"][1]["coordinates"] == ring[::-1]
+    assert records[map_id]["search_type"] == "around"
+    assert records[empty_map_id]["polygons"] == []
+
+
+def test_find_map_by_center_and_type_matches_fingerprint_lookup(monkeypatch):
+    _install_repos(monkeypatch)
+    map_id = _save_sample_map()
+    center = {"lng": 112.9388, "lat": 28.2282}
+
+    found = map_repo_module.find_map_by_center_and_type(center, " around ", ("咖啡",), "gaode", 2025)
+
+    assert found is not None and found[0] == map_id
+    assert found == map_repo_module.find_map_by_fingerprint(
+        build_center_fingerprint(center, "around", ("咖啡",), "gaode", 2025)
+    )
+    assert map_repo_module.find_map_by_center_and_type(center, "city", ("咖啡",), "gaode", 2025) is None
+
+
+def test_create_schema_replaces_legacy_fingerprint_index(monkeypatch):
+    from sqlalchemy import inspect, text
+
+    import store.database as database_module
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE map_data (id INTEGER PRIMARY KEY, data JSON NOT NULL, center JSON NOT NULL, "
+                "center_fingerprint VARCHAR(512) NOT NULL, search_type VARCHAR(20) NOT NULL, "
+                "created_at DATETIME NOT NULL, expires_at DATETIME)"
+            )
+        )
+        conn.execute(text("CREATE INDEX ix_map_data_center_fingerprint ON map_data (center_fingerprint)"))
+    monkeypatch.setattr(database_module, "engine", engine)
+
+    database_module._create_schema()
+    database_module._create_schema()
+
+    index_names = {index["name"] for index in inspect(engine).get_indexes("map_data")}
+    assert "ix_map_data_center_fingerprint" not in index_names
+    assert "ix_mapdata_fp_created" in index_names
@@ -1,12 +1,6 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from modules.nightlight import service as nightlight_service  # noqa: E402
-from modules.nightlight.types import AggregatedNightlightCell, TargetGridCell  # noqa: E402
-from nightlight_test_utils import configure_nightlight_dir, sample_gcj02_polygon  # noqa: E402
+from modules.nightlight import service as nightlight_service
+from modules.nightlight.types import AggregatedNightlightCell, TargetGridCell
+from nightlight_test_utils import configure_nightlight_dir, sample_gcj02_polygon
 
 
 def test_get_nightlight_layer_orchestrates_target_loading_and_aggregation(monkeypatch, tmp_path):
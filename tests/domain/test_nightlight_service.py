@@ -1,26 +1,20 @@
-import sys
-from pathlib import Path
-
 import numpy as np
 from rasterio.transform import from_origin
 from shapely.geometry import box
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from core.config import settings  # noqa: E402
-from modules.nightlight.aggregate import aggregate_clip_to_target_cells  # noqa: E402
-from modules.nightlight.types import NightlightClip, TargetGridCell  # noqa: E402
-from modules.nightlight.service import (  # noqa: E402
+from core.config import settings
+from modules.nightlight.aggregate import aggregate_clip_to_target_cells
+from modules.nightlight.types import NightlightClip, TargetGridCell
+from modules.nightlight.service import (
     build_nightlight_meta_payload,
     get_nightlight_grid,
     get_nightlight_layer,
     get_nightlight_overview,
     get_nightlight_raster_preview,
 )
-from modules.population.service import get_population_grid  # noqa: E402
-from modules.providers.amap.utils.transform_posi import wgs84_to_gcj02  # noqa: E402
-from nightlight_test_utils import (  # noqa: E402
+from modules.population.service import get_population_grid
+from modules.providers.amap.utils.transform_posi import wgs84_to_gcj02
+from nightlight_test_utils import (
     configure_nightlight_dir,
     sample_gcj02_polygon,
     write_population_test_dataset,
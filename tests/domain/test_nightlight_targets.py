@@ -1,11 +1,5 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from modules.nightlight.targets import load_target_cells  # noqa: E402
-from nightlight_test_utils import configure_nightlight_dir, sample_gcj02_polygon  # noqa: E402
+from modules.nightlight.targets import load_target_cells
+from nightlight_test_utils import configure_nightlight_dir, sample_gcj02_polygon
 
 
 def test_load_target_cells_from_population_grid(tmp_path):
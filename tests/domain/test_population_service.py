@@ -1,10 +1,7 @@
-import sys
 from pathlib import Path
 
 import numpy as np
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 from core.config import settings
 from modules.population.registry import age_band_keys
 from modules.population.service import (
@@ -0,0 +1,38 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import core.process_pool as process_pool_module
+
+
+class _BrokenPool:
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, *_args, **_kwargs):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_run_in_process_rebuilds_broken_pool(monkeypatch):
+    broken = _BrokenPool()
+    monkeypatch.setattr(process_pool_module.settings, "cpu_process_pool_enabled", True)
+    monkeypatch.setattr(process_pool_module, "_POOL", broken)
+    monkeypatch.setattr(process_pool_module, "ProcessPoolExecutor", lambda **_kwargs: ThreadPoolExecutor(max_workers=1))
+
+    assert asyncio.run(process_pool_module.run_in_process(pow, 2, 5)) == 32
+    assert broken.shut_down is True
+    assert process_pool_module._POOL is not broken
+    assert asyncio.run(process_pool_module.run_in_process(pow, 3, 2)) == 9
+
+    process_pool_module.shutdown_process_pool()
+
+
+def test_run_in_process_stays_in_process_when_disabled(monkeypatch):
+    monkeypatch.setattr(process_pool_module.settings, "cpu_process_pool_enabled", False)
+    monkeypatch.setattr(process_pool_module, "_POOL", None)
+
+    assert asyncio.run(process_pool_module.run_in_process(pow, 2, 3)) == 8
+    assert process_pool_module._POOL is None
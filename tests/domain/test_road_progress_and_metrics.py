@@ -1,8 +1,3 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 from modules.road.metrics import select_metric_columns
 from modules.road.progress import ROAD_SYNTAX_PROGRESS, get_road_syntax_progress, update_road_syntax_progress
 
@@ -0,0 +1,59 @@
+import numpy as np
+
+from modules.providers.amap.utils.transform_posi import wgs84_to_gcj02_arr
+
+_CENTER_LNG = 121.4737
+_CENTER_LAT = 31.2304
+_HALF_SIZE = 0.01
+
+SAMPLE_WGS84_POLYGON = (
+    (_CENTER_LNG - _HALF_SIZE, _CENTER_LAT - _HALF_SIZE),
+    (_CENTER_LNG + _HALF_SIZE, _CENTER_LAT - _HALF_SIZE),
+    (_CENTER_LNG + _HALF_SIZE, _CENTER_LAT + _HALF_SIZE),
+    (_CENTER_LNG - _HALF_SIZE, _CENTER_LAT + _HALF_SIZE),
+    (_CENTER_LNG - _HALF_SIZE, _CENTER_LAT - _HALF_SIZE),
+)
+
+
+def _to_gcj02(points):
+    # Batch transform; matches the scalar wgs84_to_gcj02 bit for bit.
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    lng, lat = wgs84_to_gcj02_arr(coords[:, 0], coords[:, 1])
+    return tuple(zip(lng.tolist(), lat.tolist()))
+
+
+# Sample coordinates are fixed, so the GCJ02 transform runs once at import time.
+SAMPLE_GCJ02_POLYGON = _to_gcj02(SAMPLE_WGS84_POLYGON)
+
+
+def sample_wgs84_polygon():
+    return [list(point) for point in SAMPLE_WGS84_POLYGON]
+
+
+def sample_gcj02_polygon():
+    return [list(point) for point in SAMPLE_GCJ02_POLYGON]
+
+
+def build_gcj02_pois(points_wgs84):
+    """Convert (lng, lat, type_code) samples once; call pois_from_samples() for fresh dicts."""
+    locations = _to_gcj02([(lng, lat) for lng, lat, _ in points_wgs84])
+    return tuple(
+        (str(idx + 1), location, type_code)
+        for idx, (location, (_, _, type_code)) in enumerate(zip(locations, points_wgs84))
+    )
+
+
+def pois_from_samples(samples):
+    return [
+        {
+            "id": poi_id,
+            "name": f"poi-{poi_id}",
+            "location": list(location),
+            "type": type_code,
+        }
+        for poi_id, location, type_code in samples
+    ]
+
+
+def fail_arcgis_bridge(**_kwargs):
+    raise RuntimeError("ArcGIS桥接失败: bridge unavailable")
@@ -1,8 +1,3 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
-
 from core.spatial import build_scope_id as core_build_scope_id
 from core.spatial import to_wgs84_geometry as core_to_wgs84_geometry
 from modules.nightlight.common import build_scope_id as nightlight_build_scope_id
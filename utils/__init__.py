@@ -1,15 +1,43 @@
 """
 工具函数入口：统一对外暴露常用方法。
+
+按需导入子模块，只用 parse_json 的调用方不必加载 jinja2。
 """
 
-from .exporter import export_map_to_xlsx
-from .templates import generate_html_content, load_type_config, render_template
+from __future__ import annotations
+
+from importlib import import_module
+
+# parse_json 很轻且与子模块同名，保持直接导入，避免子模块先被导入时属性指向模块本身
 from .parse_json import parse_json
 
+_LAZY_EXPORTS = {
+    "export_map_to_xlsx": (".exporter", "export_map_to_xlsx"),
+    "generate_html_content": (".templates", "generate_html_content"),
+    "load_type_config": (".type_config", "load_type_config"),
+    "render_template": (".templates", "render_template"),
+    "stream_html_content": (".templates", "stream_html_content"),
+    "TypeConfigError": (".type_config", "TypeConfigError"),
+}
+
+
+def __getattr__(name: str):
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module 'utils' has no attribute {name!r}")
+    module_name, attr_name = target
+    module = import_module(module_name, __name__)
+    value = getattr(module, attr_name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "export_map_to_xlsx",
     "generate_html_content",
     "load_type_config",
     "render_template",
+    "stream_html_content",
+    "TypeConfigError",
     "parse_json"
 ]
@@ -4,16 +4,16 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from io import BytesIO
-from pathlib import Path
-from typing import Iterable
-
-from openpyxl import Workbook
+from typing import Iterator
 
+from core.config import settings
 from modules.map_manage.schemas import MapRequest
 
+from .type_config import TYPE_MAP_PATH, TypeConfigError, load_type_config
+from .xlsx_fast import write_xlsx
+
 logger = logging.getLogger(__name__)
 
 HEADERS = [
@@ -29,75 +29,81 @@ HEADERS = [
     "半径(米)",
 ]
 
-_TYPE_MAP_PATH = Path(__file__).resolve().parent.parent / "share" / "type_map.json"
+
+def _type_code(raw_type: str) -> str:
+    return raw_type.removeprefix("type-")
 
 
-def _load_type_name_map() -> dict[str, tuple[str, str]]:
+def _load_type_columns() -> dict[str, tuple[str, str, str]]:
+    """读取类型配置，预先算好每个类型的 (类型编码, 大类, 中类) 三列。"""
     try:
-        data = json.loads(_TYPE_MAP_PATH.read_text(encoding="utf-8"))
-    except Exception:  # noqa: BLE001
-        logger.warning("类型配置加载失败: %s", _TYPE_MAP_PATH)
+        data = load_type_config()
+    except TypeConfigError:
+        logger.warning("类型配置加载失败: %s", TYPE_MAP_PATH)
         return {}
 
-    mapping: dict[str, tuple[str, str]] = {}
+    mapping: dict[str, tuple[str, str, str]] = {}
     for group in data.get("groups", []) or []:
         group_title = group.get("title", "") or ""
         for item in group.get("items", []) or []:
             key = item.get("point_type") or item.get("id") or ""
             if key:
-                mapping[key] = (group_title, item.get("label", "") or "")
+                mapping[key] = (_type_code(key), group_title, item.get("label", "") or "")
     return mapping
 
 
-_TYPE_NAME_MAP = _load_type_name_map()
+_TYPE_COLUMNS = _load_type_columns()
 
 
-def _iter_rows(map_request: MapRequest) -> Iterable[list]:
-    center_name = ""
-    radius = None
-    try:
-        center_name = map_request.center.get("name") or ""
-    except Exception:  # noqa: BLE001
-        center_name = ""
+def _iter_rows(map_request: MapRequest) -> Iterator[tuple]:
+    # 行直接交给 xlsx 写入器逐行消费，不在内存中累积；循环内用到的查找提前绑定为局部变量
+    # center 由模型校验为 dict，无需 try/except 兜底
+    center_name = (map_request.center or {}).get("name") or ""
     radius = map_request.radius
+    type_columns = _TYPE_COLUMNS.get
 
     for pt in map_request.points:
-        lines_text = ""
-        if pt.lines:
-            lines_text = " / ".join(pt.lines)
+        lines = pt.lines
+        if not lines:
+            lines_text = ""
+        elif len(lines) == 1:
+            # 大多数点只有一条线路，直接取值省去 join
+            lines_text = lines[0]
+        else:
+            lines_text = " / ".join(lines)
         raw_type = pt.type or ""
-        type_code = raw_type[5:] if raw_type.startswith("type-") else raw_type
-        group_name, item_name = _TYPE_NAME_MAP.get(raw_type, ("", ""))
-        yield [
+        type_code, group_name, item_name = type_columns(raw_type) or (_type_code(raw_type), "", "")
+        distance = pt.distance
+        yield (
             pt.name,
             type_code,
             group_name,
             item_name,
             pt.lng,
             pt.lat,
-            pt.distance if pt.distance is not None else "",
+            distance if distance is not None else "",
             lines_text,
             center_name,
             radius,
-        ]
+        )
 
 
-def export_map_to_xlsx(map_request: MapRequest, map_id: int | None = None) -> tuple[str, bytes]:
-    """
-    将地图数据导出为 xlsx，返回 (文件名, 文件字节)。
+def export_map_to_xlsx(map_request: MapRequest, map_id: int | None = None) -> tuple[str, BytesIO]:
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "地图数据"
-    ws.append(HEADERS)
-
-    for row in _iter_rows(map_request):
-        ws.append(row)
+    将地图数据导出为 xlsx，返回 (文件名, 已回到开头的文件缓冲区)。
 
+    直接交出缓冲区，避免 getvalue() 再复制一份完整文件。
+    """
     buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
+    write_xlsx(
+        buffer,
+        "地图数据",
+        HEADERS,
+        _iter_rows(map_request),
+        compress=settings.xlsx_compress,
+    )
 
     filename = f"map_{map_id}_data.xlsx" if map_id is not None else "map_data.xlsx"
     logger.info("导出地图数据为 xlsx: %s", filename)
-    return filename, buffer.getvalue()
+    buffer.seek(0)
+    return filename, buffer
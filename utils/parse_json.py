@@ -1,5 +1,6 @@
-import json
 from typing import Optional, Sequence
+
+import orjson
 from fastapi import HTTPException, status
 
 def parse_json(raw_value: Optional[str]) -> Optional[Sequence[str]]:
@@ -12,8 +13,8 @@ def parse_json(raw_value: Optional[str]) -> Optional[Sequence[str]]:
     if not trimmed or trimmed.lower() == "null":
         return None
     try:
-        parsed = json.loads(trimmed)
-    except json.JSONDecodeError:
+        parsed = orjson.loads(trimmed)
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="url 格式错误，应为 JSON 数组字符串",
@@ -25,4 +26,7 @@ def parse_json(raw_value: Optional[str]) -> Optional[Sequence[str]]:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="url 应为 JSON 数组",
         )
-    return [str(item) for item in parsed]
\ No newline at end of file
+    # 常见输入本就是字符串数组，直接返回解析结果，不再复制一遍
+    if all(type(item) is str for item in parsed):
+        return parsed
+    return [item if type(item) is str else str(item) for item in parsed]
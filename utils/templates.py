@@ -4,55 +4,52 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import AsyncIterator
 
+import orjson
 from fastapi import HTTPException, status
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
 
 from core.config import settings
 
+from .type_config import TypeConfigError, type_config_json_text
+
 logger = logging.getLogger(__name__)
 
+# 模板部署后不会变化，关闭 auto_reload 省去每次渲染前的文件 mtime 检查；
+# 模板数量固定，缓存不设上限，编译结果常驻内存
 _templates_env = Environment(
     loader=FileSystemLoader(Path(settings.templates_dir).resolve()),
     autoescape=False,
+    auto_reload=False,
+    cache_size=-1,
+    enable_async=True,
 )
 
 
-def load_type_config() -> dict:
-    """读取统一类型配置（前后端共用）。"""
-    path = Path(__file__).resolve().parent.parent / "share" / "type_map.json"
+@lru_cache(maxsize=1)
+def _get_template() -> Template:
+    # 编译后的模板对象直接复用，请求路径上不再经过 Environment 的加载与缓存查找；找不到模板时不缓存
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except FileNotFoundError:
-        logger.error("类型配置文件不存在: %s", path)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="类型配置文件不存在，请联系管理员",
-        )
-    except Exception as exc:  # noqa: BLE001
-        logger.error("类型配置文件读取失败: %s", exc)
+        return _templates_env.get_template(settings.template_name)
+    except TemplateNotFound:
+        logger.error("模板文件不存在: %s", settings.template_name)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"类型配置文件读取失败: {exc}",
+            detail="模板文件不存在，请联系管理员",
         )
 
 
 async def render_template(context: dict | None = None) -> str:
     """渲染Jinja模板，返回HTML文本。"""
+    template = _get_template()
     try:
-        template = _templates_env.get_template(settings.template_name)
-        content = template.render(**(context or {}))
+        content = await template.render_async(**(context or {}))
         logger.debug("模板渲染成功: %s", settings.template_name)
         return content
-    except TemplateNotFound:
-        logger.error("模板文件不存在: %s", settings.template_name)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="模板文件不存在，请联系管理员",
-        )
     except Exception as exc:  # noqa: BLE001
         logger.error("模板渲染失败: %s", exc)
         raise HTTPException(
@@ -61,12 +58,19 @@ async def render_template(context: dict | None = None) -> str:
         )
 
 
-async def generate_html_content(data, map_id: int | None = None) -> str:
+def build_html_context(data, map_id: int | None = None) -> dict:
     """
-    异步生成HTML内容：读取模板并替换变量。
+    准备地图页模板上下文。
     """
-    data_json = json.dumps(data.model_dump(), ensure_ascii=False, indent=4)
-    type_config_json = json.dumps(load_type_config(), ensure_ascii=False)
+    # orjson 直接输出 UTF-8，无需 ensure_ascii；数据只给页面脚本读取，不做缩进
+    data_json = orjson.dumps(data.model_dump(), option=orjson.OPT_NON_STR_KEYS).decode()
+    try:
+        type_config_json = type_config_json_text()
+    except TypeConfigError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(exc),
+        ) from exc
 
     js_key = (settings.amap_js_api_key or "").strip()
     if not js_key:
@@ -75,15 +79,40 @@ async def generate_html_content(data, map_id: int | None = None) -> str:
             detail="AMAP_JS_API_KEY 未配置",
         )
     js_security = (settings.amap_js_security_code or "").strip()
+    return {
+        "map_data_json": data_json,
+        "map_type_config_json": type_config_json,
+        "amap_js_api_key": js_key,
+        "amap_js_security_code": js_security,
+        "map_id": map_id,
+    }
+
 
-    html_content = await render_template(
-        {
-            "map_data_json": data_json,
-            "map_type_config_json": type_config_json,
-            "amap_js_api_key": js_key,
-            "amap_js_security_code": js_security,
-            "map_id": map_id,
-        }
-    )
+async def generate_html_content(data, map_id: int | None = None) -> str:
+    """
+    异步生成HTML内容：读取模板并替换变量。
+    """
+    html_content = await render_template(build_html_context(data, map_id=map_id))
     logger.debug("HTML内容生成成功")
     return html_content
+
+
+def stream_html_content(data, map_id: int | None = None) -> AsyncIterator[str]:
+    """
+    以分块方式渲染地图页，供 StreamingResponse 边渲染边发送。
+
+    上下文与模板在返回前准备好，配置或模板缺失时仍以 HTTPException 报错；
+    开始发送后的渲染异常只能记录日志并中断响应。
+    """
+    template = _get_template()
+    context = build_html_context(data, map_id=map_id)
+
+    async def _chunks() -> AsyncIterator[str]:
+        try:
+            async for chunk in template.generate_async(**context):
+                yield chunk
+        except Exception as exc:  # noqa: BLE001
+            logger.error("模板流式渲染失败: %s", exc)
+            raise
+
+    return _chunks()
@@ -0,0 +1,49 @@
+"""
+统一类型配置（share/type_map.json）读取。
+
+地图页、前端配置接口与 xlsx 导出共用同一份解析结果，进程内只读一次文件。
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+TYPE_MAP_PATH = Path(__file__).resolve().parent.parent / "share" / "type_map.json"
+
+
+class TypeConfigError(RuntimeError):
+    """类型配置文件缺失或无法解析；路由层负责转换为 HTTP 500。"""
+
+
+def _read_type_config() -> dict:
+    try:
+        return orjson.loads(TYPE_MAP_PATH.read_bytes())
+    except FileNotFoundError:
+        logger.error("类型配置文件不存在: %s", TYPE_MAP_PATH)
+        raise TypeConfigError("类型配置文件不存在，请联系管理员") from None
+    except Exception as exc:  # noqa: BLE001
+        logger.error("类型配置文件读取失败: %s", exc)
+        raise TypeConfigError(f"类型配置文件读取失败: {exc}") from exc
+
+
+@lru_cache(maxsize=1)
+def _cached_type_config() -> tuple[dict, str]:
+    # 类型配置部署后不变，解析结果与序列化后的 JSON 文本只需计算一次；读取失败不会被缓存
+    config = _read_type_config()
+    return config, orjson.dumps(config).decode()
+
+
+def load_type_config() -> dict:
+    """读取统一类型配置（前后端共用）。返回共享的缓存对象，调用方不要修改。"""
+    return _cached_type_config()[0]
+
+
+def type_config_json_text() -> str:
+    """类型配置序列化后的 JSON 文本，供模板直接嵌入。"""
+    return _cached_type_config()[1]
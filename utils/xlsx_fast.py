@@ -0,0 +1,189 @@
+"""
+轻量 xlsx 写入：固定单工作表，直接生成 SpreadsheetML 并写入 zip。
+
+导出数据只有字符串与数值两类标量，不需要 openpyxl 为每个单元格构造对象；
+工作表 XML 按行流式写入 zip 条目，内存占用与行数无关。
+"""
+
+from __future__ import annotations
+
+import math
+import numbers
+import re
+from functools import lru_cache
+from typing import IO, Iterable, Sequence
+from xml.sax.saxutils import quoteattr
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+_XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+_CONTENT_TYPES_XML = (
+    _XML_DECL
+    + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+
+_ROOT_RELS_XML = (
+    _XML_DECL
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+_WORKBOOK_RELS_XML = (
+    _XML_DECL
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+    "</Relationships>"
+)
+
+# Excel 要求的最小样式表：一个字体、两个默认填充、一个边框、一个单元格格式与 Normal 样式
+_STYLES_XML = (
+    _XML_DECL
+    + f'<styleSheet xmlns="{_MAIN_NS}">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+WRITE_CHUNK_CHARS = 64 * 1024
+
+_SHEET_HEAD = (_XML_DECL + f'<worksheet xmlns="{_MAIN_NS}"><sheetData>').encode("utf-8")
+_SHEET_TAIL = b"</sheetData></worksheet>"
+
+# XML 1.0 不允许的控制字符，写入前剔除（openpyxl 遇到会直接抛错）
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+# 导出表的列数很少，预先算好列字母，避免逐单元格换算
+_COLUMN_LETTERS = tuple(_column_letter(index) for index in range(64))
+
+
+def _column_name(index: int) -> str:
+    return _COLUMN_LETTERS[index] if index < len(_COLUMN_LETTERS) else _column_letter(index)
+
+
+def _text_xml(value: str) -> str:
+    # 绝大多数文本不含控制字符，isprintable() 在 C 层先筛一遍，命中时才走正则剔除
+    if not value.isprintable():
+        value = _ILLEGAL_XML_CHARS.sub("", value)
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _cell_xml(ref: str, value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        if not value:
+            return ""
+        return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{_text_xml(value)}</t></is></c>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    # numpy 等标量先转成内置类型再格式化，repr 才不会带上类型名
+    if isinstance(value, numbers.Integral):
+        return f'<c r="{ref}"><v>{int(value)}</v></c>'
+    if isinstance(value, numbers.Real):
+        number = float(value)
+        return f'<c r="{ref}"><v>{float.__repr__(number)}</v></c>' if math.isfinite(number) else ""
+    return _cell_xml(ref, str(value))
+
+
+def row_xml(row_number: int, values: Sequence) -> str:
+    """生成一行 <row> XML；空字符串与 None 不输出单元格，单元格带显式引用以保持列位置。"""
+    # 逐行调用的热点：str / float / int 三种常见类型就地拼接，其余类型交给 _cell_xml
+    row = str(row_number)
+    parts = [f'<row r="{row}">']
+    append = parts.append
+    for col, value in enumerate(values):
+        value_type = type(value)
+        if value_type is str:
+            if value:
+                append(
+                    f'<c r="{_column_name(col)}{row}" t="inlineStr">'
+                    f'<is><t xml:space="preserve">{_text_xml(value)}</t></is></c>'
+                )
+        elif value_type is float:
+            if math.isfinite(value):
+                append(f'<c r="{_column_name(col)}{row}"><v>{value!r}</v></c>')
+        elif value_type is int:
+            append(f'<c r="{_column_name(col)}{row}"><v>{value}</v></c>')
+        elif value is not None:
+            append(_cell_xml(f"{_column_name(col)}{row}", value))
+    append("</row>")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=8)
+def _header_row_bytes(headers: tuple[str, ...]) -> bytes:
+    # 表头每次导出都相同，整行 XML 只生成一次
+    return row_xml(1, headers).encode("utf-8")
+
+
+def write_xlsx(
+    target: IO[bytes],
+    sheet_name: str,
+    headers: Sequence[str],
+    rows: Iterable[Sequence],
+    compress: bool = True,
+) -> None:
+    """
+    把表头与数据行写成单工作表 xlsx，target 为可写的二进制文件对象。
+
+    compress=False 时各条目按 ZIP_STORED 存储，省去 deflate 的 CPU 开销，文件体积明显变大。
+    """
+    workbook_xml = (
+        _XML_DECL
+        + f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheets>'
+        f'<sheet name={quoteattr(sheet_name)} sheetId="1" r:id="rId1"/>'
+        "</sheets></workbook>"
+    )
+    compression = ZIP_DEFLATED if compress else ZIP_STORED
+    with ZipFile(target, mode="w", compression=compression) as zf:
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        zf.writestr("_rels/.rels", _ROOT_RELS_XML)
+        zf.writestr("xl/workbook.xml", workbook_xml)
+        zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+        zf.writestr("xl/styles.xml", _STYLES_XML)
+        # 工作表按流写入，事先不知道大小；强制 ZIP64 头，条目超过 2 GiB 时也能正常关闭
+        with zf.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True) as sheet:
+            sheet.write(_SHEET_HEAD)
+            sheet.write(_header_row_bytes(tuple(headers)))
+            # 行 XML 先攒到约 64 KiB 再写入，减少逐行调用压缩器的开销
+            pending: list[str] = []
+            pending_size = 0
+            for row_number, values in enumerate(rows, start=2):
+                row = row_xml(row_number, values)
+                pending.append(row)
+                pending_size += len(row)
+                if pending_size >= WRITE_CHUNK_CHARS:
+                    sheet.write("".join(pending).encode("utf-8"))
+                    pending.clear()
+                    pending_size = 0
+            if pending:
+                sheet.write("".join(pending).encode("utf-8"))
+            sheet.write(_SHEET_TAIL)